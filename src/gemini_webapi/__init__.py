@@ -1,24 +1,60 @@
-from .client import ChatSession, GeminiClient
-from .exceptions import (
-    APIError,
-    AuthError,
-    GeminiError,
-    ImageGenerationBlocked,
-    ImageGenerationError,
-    ImageModelMismatch,
-    ModelInvalid,
-    RateLimitExceeded,
-    RequestTimeoutError,
-    TemporarilyBlocked,
-    UsageLimitExceeded,
-)
-from .types import Candidate, Gem, GemJar, GeneratedImage, GeneratedVideo, Image, ModelOutput, RPCData, WebImage
-from .utils import (
-    load_netscape_cookies,
-    load_netscape_cookies_as_dict,
-    logger,
-    set_log_level,
-)
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import ChatSession, GeminiClient
+    from .exceptions import (
+        APIError,
+        AuthError,
+        GeminiError,
+        ImageGenerationBlocked,
+        ImageGenerationError,
+        ImageModelMismatch,
+        ModelInvalid,
+        RateLimitExceeded,
+        RequestTimeoutError,
+        TemporarilyBlocked,
+        UsageLimitExceeded,
+    )
+    from .types import Candidate, Gem, GemJar, GeneratedImage, GeneratedVideo, Image, ModelOutput, RPCData, WebImage
+    from .utils import (
+        load_netscape_cookies,
+        load_netscape_cookies_as_dict,
+        logger,
+        set_log_level,
+    )
+
+# Public name -> (module, attribute). Submodules are only imported on first access,
+# so e.g. `from gemini_webapi import AuthError` does not pull in curl_cffi or pydantic.
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "APIError": ("gemini_webapi.exceptions", "APIError"),
+    "AuthError": ("gemini_webapi.exceptions", "AuthError"),
+    "Candidate": ("gemini_webapi.types", "Candidate"),
+    "ChatSession": ("gemini_webapi.client", "ChatSession"),
+    "Gem": ("gemini_webapi.types", "Gem"),
+    "GemJar": ("gemini_webapi.types", "GemJar"),
+    "GeminiClient": ("gemini_webapi.client", "GeminiClient"),
+    "GeminiError": ("gemini_webapi.exceptions", "GeminiError"),
+    "GeneratedImage": ("gemini_webapi.types", "GeneratedImage"),
+    "GeneratedVideo": ("gemini_webapi.types", "GeneratedVideo"),
+    "Image": ("gemini_webapi.types", "Image"),
+    "ImageGenerationBlocked": ("gemini_webapi.exceptions", "ImageGenerationBlocked"),
+    "ImageGenerationError": ("gemini_webapi.exceptions", "ImageGenerationError"),
+    "ImageModelMismatch": ("gemini_webapi.exceptions", "ImageModelMismatch"),
+    "ModelInvalid": ("gemini_webapi.exceptions", "ModelInvalid"),
+    "ModelOutput": ("gemini_webapi.types", "ModelOutput"),
+    "RPCData": ("gemini_webapi.types", "RPCData"),
+    "RateLimitExceeded": ("gemini_webapi.exceptions", "RateLimitExceeded"),
+    "RequestTimeoutError": ("gemini_webapi.exceptions", "RequestTimeoutError"),
+    "TemporarilyBlocked": ("gemini_webapi.exceptions", "TemporarilyBlocked"),
+    "UsageLimitExceeded": ("gemini_webapi.exceptions", "UsageLimitExceeded"),
+    "WebImage": ("gemini_webapi.types", "WebImage"),
+    "load_netscape_cookies": ("gemini_webapi.utils", "load_netscape_cookies"),
+    "load_netscape_cookies_as_dict": ("gemini_webapi.utils", "load_netscape_cookies_as_dict"),
+    "logger": ("gemini_webapi.utils", "logger"),
+    "set_log_level": ("gemini_webapi.utils", "set_log_level"),
+}
 
 __all__ = [
     "APIError",
@@ -48,3 +84,18 @@ __all__ = [
     "logger",
     "set_log_level",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    obj = getattr(import_module(module_name), attr)
+    setattr(sys.modules[__name__], name, obj)
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
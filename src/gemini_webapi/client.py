@@ -12,11 +12,22 @@ from typing import Any, Optional
 
 import orjson as json
 from curl_cffi import CurlHttpVersion
-from curl_cffi.requests import AsyncSession, Cookies, Response
+from curl_cffi.requests import AsyncSession, Cookies, Headers, Response
 from curl_cffi.requests.errors import RequestsError
 
 from .components import GemMixin
-from .constants import GRPC, Endpoint, ErrorCode, Headers, Model
+from .constants import (
+    GEMINI_HEADERS,
+    GRPC,
+    IP_TEMPORARILY_BLOCKED,
+    MODEL_HEADER_INVALID,
+    MODEL_INCONSISTENT,
+    TEMPORARY_ERROR_1013,
+    USAGE_LIMIT_EXCEEDED,
+    CustomModel,
+    Endpoint,
+    Model,
+)
 from .exceptions import (
     APIError,
     AuthError,
@@ -43,13 +54,16 @@ from .utils import (
     get_delta_by_fp_len,
     get_nested_value,
     logger,
-    parse_file_name,
     parse_response_by_frame,
     rotate_1psidts,
     running,
-    upload_file,
+    upload_files,
 )
 
+# Per-model request headers, normalized once. curl_cffi copies a `Headers` instance as-is when merging
+# it with the session headers, instead of re-encoding every key and value on each request.
+_MODEL_REQUEST_HEADERS: dict[Model, Headers] = {model: Headers(model.model_header) for model in Model}
+
 
 @dataclass(slots=True)
 class _StreamingState:
@@ -74,24 +88,26 @@ class _StreamFlags:
 
 def _raise_for_error_code(error_code: int, model_name: str) -> None:
     """Raise appropriate exception for API error codes."""
-    match error_code:
-        case ErrorCode.USAGE_LIMIT_EXCEEDED:
-            raise UsageLimitExceeded(
-                f"Usage limit exceeded for model '{model_name}'. Please wait a few minutes, switch to a different model (e.g., Gemini Flash), or check your account limits on gemini.google.com."
-            )
-        case ErrorCode.MODEL_INCONSISTENT:
-            raise ModelInvalid("The specified model is inconsistent with the conversation history. Please ensure you are using the same 'model' parameter throughout the entire ChatSession.")
-        case ErrorCode.MODEL_HEADER_INVALID:
-            raise ModelInvalid(
-                f"The model '{model_name}' is currently unavailable or the request structure is outdated. "
-                "Please update 'gemini_webapi' to the latest version or report this on GitHub if the problem persists."
-            )
-        case ErrorCode.IP_TEMPORARILY_BLOCKED:
-            raise TemporarilyBlocked("Your IP address has been temporarily flagged or blocked by Google. Please try using a proxy, a different network, or wait for a while before retrying.")
-        case ErrorCode.TEMPORARY_ERROR_1013:
-            raise APIError("Gemini encountered a temporary error (1013). Retrying...")
-        case _:
-            raise APIError(f"Failed to generate contents (stream). Unknown API error code: {error_code}. This might be a temporary Google service issue.")
+    if error_code == USAGE_LIMIT_EXCEEDED:
+        raise UsageLimitExceeded(
+            f"Usage limit exceeded for model '{model_name}'. Please wait a few minutes, switch to a different model (e.g., Gemini Flash), or check your account limits on gemini.google.com."
+        )
+    if error_code == MODEL_INCONSISTENT:
+        raise ModelInvalid("The specified model is inconsistent with the conversation history. Please ensure you are using the same 'model' parameter throughout the entire ChatSession.")
+    if error_code == MODEL_HEADER_INVALID:
+        raise ModelInvalid(
+            f"The model '{model_name}' is currently unavailable or the request structure is outdated. "
+            "Please update 'gemini_webapi' to the latest version or report this on GitHub if the problem persists."
+        )
+    if error_code == IP_TEMPORARILY_BLOCKED:
+        raise TemporarilyBlocked("Your IP address has been temporarily flagged or blocked by Google. Please try using a proxy, a different network, or wait for a while before retrying.")
+    if error_code == TEMPORARY_ERROR_1013:
+        raise APIError("Gemini encountered a temporary error (1013). Retrying...")
+    raise APIError(f"Failed to generate contents (stream). Unknown API error code: {error_code}. This might be a temporary Google service issue.")
+
+
+# The parsers below build their models with `model_construct`: every field comes from the client itself or
+# from a parsed response, so re-running pydantic validation for each image or video only costs time.
 
 
 def _parse_web_images(candidate_data: list[Any], proxy: str | None, session_kwargs: dict | None = None) -> list[WebImage]:
@@ -101,7 +117,7 @@ def _parse_web_images(candidate_data: list[Any], proxy: str | None, session_kwar
         url = get_nested_value(web_img_data, [0, 0, 0])
         if url:
             web_images.append(
-                WebImage(
+                WebImage.model_construct(
                     url=url,
                     title=get_nested_value(web_img_data, [7, 0], ""),
                     alt=get_nested_value(web_img_data, [0, 4], ""),
@@ -120,7 +136,7 @@ def _parse_generated_images(candidate_data: list[Any], proxy: str | None, cookie
         if url:
             img_num = get_nested_value(gen_img_data, [3, 6])
             generated_images.append(
-                GeneratedImage(
+                GeneratedImage.model_construct(
                     url=url,
                     title=f"[Generated Image {img_num}]" if img_num else "[Generated Image]",
                     alt=get_nested_value(gen_img_data, [3, 5, 0], ""),
@@ -167,7 +183,7 @@ def _parse_generated_videos(candidate_data: list[Any], proxy: str | None, cookie
 
             video_num = len(generated_videos) + 1
             generated_videos.append(
-                GeneratedVideo(
+                GeneratedVideo.model_construct(
                     url=download_url,
                     thumbnail_url=thumbnail_url,
                     title=f"[Generated Video {video_num}]",
@@ -293,6 +309,7 @@ class GeminiClient(GemMixin):
     """
 
     __slots__ = [
+        "__weakref__",
         "_gems",  # From GemMixin
         "_lock",
         "_reqid",
@@ -396,16 +413,23 @@ class GeminiClient(GemMixin):
                 # Store kwargs for use by Image/Video save methods
                 self.session_kwargs = dict(self.kwargs)
 
-                # Create session first and reuse it for get_access_token
-                self.client = AsyncSession(
-                    timeout=timeout,
-                    proxy=self.proxy,
-                    allow_redirects=True,
-                    http_version=CurlHttpVersion.V2_0,
-                    impersonate=self.kwargs.pop("impersonate", "chrome"),
-                    **self.kwargs,
-                )
-                self.client.headers.update(Headers.GEMINI.value)
+                # Create session first and reuse it for get_access_token. A session kept by `reset()`
+                # is reused as-is, so its warm connections and TLS session tickets survive re-initialization.
+                if self.client is None:
+                    if self.access_token:
+                        logger.debug("Opening a new HTTP session, previous connections are discarded.")
+
+                    self.client = AsyncSession(
+                        timeout=timeout,
+                        proxy=self.proxy,
+                        allow_redirects=True,
+                        http_version=CurlHttpVersion.V2_0,
+                        impersonate=self.kwargs.pop("impersonate", "chrome"),
+                        **self.kwargs,
+                    )
+                    self.client.headers.update(GEMINI_HEADERS)
+                else:
+                    self.client.timeout = timeout
 
                 access_token, build_label, session_id, valid_cookies = await get_access_token(
                     base_cookies=self.cookies,
@@ -457,19 +481,29 @@ class GeminiClient(GemMixin):
         if delay:
             await asyncio.sleep(delay)
 
-        self._running = False
+        await self.reset()
 
         if self.close_task:
             self.close_task.cancel()
             self.close_task = None
 
+        if self.client:
+            # Detach first so a cancelled close never leaves a half-closed session around for `init()` to reuse
+            client, self.client = self.client, None
+            await client.close()
+
+    async def reset(self) -> None:
+        """
+        Mark the client as not running so the next request re-initializes it, while keeping the underlying
+        HTTP session (and its pooled connections) open. Use `close()` to release the session as well.
+        """
+
+        self._running = False
+
         if self.refresh_task:
             self.refresh_task.cancel()
             self.refresh_task = None
 
-        if self.client:
-            await self.client.close()
-
     async def reset_close_task(self) -> None:
         """
         Reset the timer for closing the client when a new request is made.
@@ -497,7 +531,8 @@ class GeminiClient(GemMixin):
             try:
                 async with self._lock:
                     # Refresh all cookies in the background to keep the session alive.
-                    new_1psidts, rotated_cookies = await rotate_1psidts(self.cookies, self.proxy)
+                    # Rotate over the client's session so the refresh doesn't open a new connection each interval
+                    new_1psidts, rotated_cookies = await rotate_1psidts(self.cookies, self.proxy, session=self.client)
                     if rotated_cookies:
                         self.cookies.update(rotated_cookies)
                         if self.client:
@@ -588,8 +623,8 @@ class GeminiClient(GemMixin):
                 ]
             )
 
-            uploaded_urls = await asyncio.gather(*(upload_file(file, self.proxy, session=self.client, account_index=self.account_index) for file in files))
-            file_data = [[[url], parse_file_name(file)] for url, file in zip(uploaded_urls, files, strict=True)]
+            uploaded = await upload_files(files, self.proxy, session=self.client, account_index=self.account_index)
+            file_data = [[[url], filename] for url, filename in uploaded]
 
         try:
             await self._batch_execute(
@@ -717,8 +752,8 @@ class GeminiClient(GemMixin):
                 ]
             )
 
-            uploaded_urls = await asyncio.gather(*(upload_file(file, self.proxy, session=self.client, account_index=self.account_index) for file in files))
-            file_data = [[[url], parse_file_name(file)] for url, file in zip(uploaded_urls, files, strict=True)]
+            uploaded = await upload_files(files, self.proxy, session=self.client, account_index=self.account_index)
+            file_data = [[[url], filename] for url, filename in uploaded]
 
         try:
             await self._batch_execute(
@@ -800,7 +835,7 @@ class GeminiClient(GemMixin):
             model = Model.from_name(model)
         elif isinstance(model, dict):
             model = Model.from_dict(model)
-        elif not isinstance(model, Model):
+        elif not isinstance(model, (Model, CustomModel)):
             raise TypeError(f"'model' must be a `gemini_webapi.constants.Model` instance, string, or dictionary; got `{type(model).__name__}`")
 
         _reqid = self._reqid
@@ -853,14 +888,14 @@ class GeminiClient(GemMixin):
                 "POST",
                 Endpoint.get_generate_url(self.account_index),
                 params=params,
-                headers=model.model_header,
+                headers=_MODEL_REQUEST_HEADERS.get(model, model.model_header),
                 data=request_data,
                 stream=True,
                 **kwargs,
             )
 
             if response.status_code != 200:
-                await self.close()
+                await self.reset()
                 raise APIError(f"Failed to generate contents. Status: {response.status_code}")
 
             if self.client:
@@ -898,7 +933,8 @@ class GeminiClient(GemMixin):
 
                 stall_threshold = min(self.timeout, self.watchdog_timeout)
                 if (time.time() - last_progress_time) > stall_threshold:
-                    logger.warning(f"Response stalled (active connection but no progress for {stall_threshold}s). Queueing={flags.is_queueing}. Retrying...")
+                    logger.warning(f"Response stalled (active connection but no progress for {stall_threshold}s). Queueing={flags.is_queueing}. Reconnecting...")
+                    # The connection itself is suspect here, so drop the session instead of keeping it warm
                     await self.close()
                     raise APIError("Response stalled (zombie stream).")
 
@@ -931,7 +967,7 @@ class GeminiClient(GemMixin):
     async def _process_stream_part(
         self,
         part: list[Any],
-        model: Model,
+        model: Model | CustomModel,
         chat: Optional["ChatSession"],
         last_texts: dict[str, str],
         last_thoughts: dict[str, str],
@@ -942,7 +978,7 @@ class GeminiClient(GemMixin):
         # Check for fatal error codes
         error_code = get_nested_value(part, [5, 2, 0, 1, 0])
         if error_code:
-            await self.close()
+            await self.reset()
             _raise_for_error_code(error_code, model.model_name)
 
         # Detect thinking state and image model
@@ -1009,7 +1045,7 @@ class GeminiClient(GemMixin):
 
         flags.is_thinking = False
         flags.is_queueing = False
-        return ModelOutput(
+        return ModelOutput.model_construct(
             metadata=get_nested_value(part_json, [1], []),
             candidates=output_candidates,
         )
@@ -1184,7 +1220,7 @@ class GeminiClient(GemMixin):
             raise
 
         if response.status_code != 200:
-            await self.close()
+            await self.reset()
             raise APIError(f"Batch execution failed with status code {response.status_code}")
 
         if self.client:
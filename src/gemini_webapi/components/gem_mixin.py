@@ -13,6 +13,9 @@ class GemMixin:
     Mixin class providing gem-related functionality for GeminiClient.
     """
 
+    # Empty so that the slots declared by GeminiClient take effect (a slot-less base would add a __dict__)
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._gems: GemJar | None = None
@@ -99,7 +102,7 @@ class GemMixin:
             if not predefined_gems and not custom_gems:
                 raise ValueError("No gems found in response")
         except Exception as exc:
-            await self.close()
+            await self.reset()
             logger.debug(f"Unexpected response data structure: {response.text}")
             raise APIError("Failed to fetch gems. Unexpected response data structure. Client will try to re-initialize on next request.") from exc
 
@@ -195,7 +198,7 @@ class GemMixin:
             if not gem_id:
                 raise ValueError("No gem ID found in response")
         except Exception as exc:
-            await self.close()
+            await self.reset()
             logger.debug(f"Unexpected response data structure: {response.text}")
             raise APIError("Failed to create gem. Unexpected response data structure. Client will try to re-initialize on next request.") from exc
 
@@ -1,4 +1,22 @@
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from enum import Enum, IntEnum, StrEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final
+
+
+def _account_prefix(account_index: int) -> str:
+    """Get the account path prefix for URLs (e.g., '/u/2' or '')."""
+    if account_index <= 0:
+        return ""
+    return _nonzero_account_prefix(account_index)
+
+
+@lru_cache(maxsize=8)
+def _nonzero_account_prefix(account_index: int) -> str:
+    return f"/u/{account_index}"
 
 
 class Endpoint(StrEnum):
@@ -10,11 +28,7 @@ class Endpoint(StrEnum):
     BATCH_EXEC = "https://gemini.google.com/_/BardChatUi/data/batchexecute"
 
     @staticmethod
-    def _get_account_prefix(account_index: int) -> str:
-        """Get the account path prefix for URLs (e.g., '/u/2' or '')."""
-        return f"/u/{account_index}" if account_index > 0 else ""
-
-    @staticmethod
+    @lru_cache(maxsize=16)
     def get_init_url(account_index: int = 0) -> str:
         """
         Get the initialization URL for a specific Google account.
@@ -34,10 +48,11 @@ class Endpoint(StrEnum):
         str
             The full URL to initialize the Gemini client for the specified account.
         """
-        prefix = Endpoint._get_account_prefix(account_index)
+        prefix = _account_prefix(account_index)
         return f"https://gemini.google.com{prefix}/app"
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def get_generate_url(account_index: int = 0) -> str:
         """
         Get the generate/streaming URL for a specific Google account.
@@ -52,10 +67,11 @@ class Endpoint(StrEnum):
         str
             The full URL for the StreamGenerate endpoint for the specified account.
         """
-        prefix = Endpoint._get_account_prefix(account_index)
+        prefix = _account_prefix(account_index)
         return f"https://gemini.google.com{prefix}/_/BardChatUi/data/assistant.lamda.BardFrontendService/StreamGenerate"
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def get_batch_exec_url(account_index: int = 0) -> str:
         """
         Get the batch execute URL for a specific Google account.
@@ -70,10 +86,11 @@ class Endpoint(StrEnum):
         str
             The full URL for the batchexecute endpoint for the specified account.
         """
-        prefix = Endpoint._get_account_prefix(account_index)
+        prefix = _account_prefix(account_index)
         return f"https://gemini.google.com{prefix}/_/BardChatUi/data/batchexecute"
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def get_source_path(account_index: int = 0) -> str:
         """
         Get the source-path parameter value for a specific Google account.
@@ -88,10 +105,11 @@ class Endpoint(StrEnum):
         str
             The source-path value (e.g., '/app' or '/u/2/app').
         """
-        prefix = Endpoint._get_account_prefix(account_index)
+        prefix = _account_prefix(account_index)
         return f"{prefix}/app"
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def get_upload_url(account_index: int = 0) -> str:
         """
         Get the file upload URL for a specific Google account.
@@ -131,18 +149,35 @@ class GRPC(StrEnum):
     BARD_ACTIVITY = "ESY5D"
 
 
-class Headers(Enum):
-    GEMINI = {
+GEMINI_HEADERS = MappingProxyType(
+    {
         "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
         "Origin": "https://gemini.google.com",
         "Referer": "https://gemini.google.com/",
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
         "X-Same-Domain": "1",
     }
-    ROTATE_COOKIES = {
+)
+ROTATE_COOKIES_HEADERS = MappingProxyType(
+    {
         "Content-Type": "application/json",
     }
-    # Note: UPLOAD headers are now defined in upload_file.py for the resumable upload protocol
+)
+# Note: UPLOAD headers are now defined in upload_file.py for the resumable upload protocol
+
+
+class Headers(Enum):
+    """
+    Kept for backward compatibility, internal code uses the module-level constants above directly.
+    """
+
+    GEMINI = GEMINI_HEADERS
+    ROTATE_COOKIES = ROTATE_COOKIES_HEADERS
+
+
+def _intern_header(header: Mapping[str, str]) -> dict[str, str]:
+    """Copy a header mapping, interning string values so repeated requests share a single object."""
+    return {k: sys.intern(v) if isinstance(v, str) else v for k, v in header.items()}
 
 
 class Model(Enum):
@@ -165,16 +200,16 @@ class Model(Enum):
 
     def __init__(self, name, header, advanced_only):
         self.model_name = name
-        self.model_header = header
         self.advanced_only = advanced_only
+        # Headers are fixed for the lifetime of the process, so they are frozen once here
+        self.model_header = MappingProxyType(_intern_header(header))
 
     @classmethod
     def from_name(cls, name: str):
-        for model in cls:
-            if model.model_name == name:
-                return model
-
-        raise ValueError(f"Unknown model name: {name}. Available models: {', '.join([model.model_name for model in cls])}")
+        try:
+            return cls._by_name[name]
+        except KeyError:
+            raise ValueError(f"Unknown model name: {name}. Available models: {cls._names_csv}") from None
 
     @classmethod
     def from_dict(cls, model_dict: dict):
@@ -184,10 +219,35 @@ class Model(Enum):
         if not isinstance(model_dict["model_header"], dict):
             raise ValueError("When passing a custom model as a dictionary, 'model_header' must be a dictionary containing valid header strings.")
 
-        custom_model = cls.UNSPECIFIED
-        custom_model.model_name = model_dict["model_name"]
-        custom_model.model_header = model_dict["model_header"]
-        return custom_model
+        return CustomModel(model_name=model_dict["model_name"], model_header=model_dict["model_header"])
+
+
+@dataclass(frozen=True, slots=True)
+class CustomModel:
+    """
+    A user-defined model built from a dictionary, exposing the same attributes as a `Model` member.
+
+    Parameters
+    ----------
+    model_name: `str`
+        Name of the model.
+    model_header: `dict`
+        Extra request headers identifying the model.
+    advanced_only: `bool`, optional
+        Whether the model requires an advanced subscription.
+    """
+
+    model_name: str
+    model_header: Mapping[str, str] = field(hash=False)
+    advanced_only: bool = False
+
+    def __post_init__(self):
+        object.__setattr__(self, "model_header", MappingProxyType(_intern_header(self.model_header)))
+
+
+# Name lookup tables, built once after the enum is created (enum bodies can't hold plain attributes)
+Model._by_name = {m.model_name: m for m in Model}
+Model._names_csv = ", ".join(Model._by_name)
 
 
 class ErrorCode(IntEnum):
@@ -200,3 +260,11 @@ class ErrorCode(IntEnum):
     MODEL_INCONSISTENT = 1050
     MODEL_HEADER_INVALID = 1052
     IP_TEMPORARILY_BLOCKED = 1060
+
+
+# Plain int aliases of the error codes, so the package's own dispatch compares ints without going through enum members
+TEMPORARY_ERROR_1013: Final[int] = ErrorCode.TEMPORARY_ERROR_1013.value
+USAGE_LIMIT_EXCEEDED: Final[int] = ErrorCode.USAGE_LIMIT_EXCEEDED.value
+MODEL_INCONSISTENT: Final[int] = ErrorCode.MODEL_INCONSISTENT.value
+MODEL_HEADER_INVALID: Final[int] = ErrorCode.MODEL_HEADER_INVALID.value
+IP_TEMPORARILY_BLOCKED: Final[int] = ErrorCode.IP_TEMPORARILY_BLOCKED.value
@@ -1,9 +1,26 @@
-from .candidate import Candidate
-from .gem import Gem, GemJar
-from .grpc import RPCData
-from .image import GeneratedImage, Image, WebImage
-from .modeloutput import ModelOutput
-from .video import GeneratedVideo
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .candidate import Candidate
+    from .gem import Gem, GemJar
+    from .grpc import RPCData
+    from .image import GeneratedImage, Image, WebImage
+    from .modeloutput import ModelOutput
+    from .video import GeneratedVideo
+
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "Candidate": ("gemini_webapi.types.candidate", "Candidate"),
+    "Gem": ("gemini_webapi.types.gem", "Gem"),
+    "GemJar": ("gemini_webapi.types.gem", "GemJar"),
+    "GeneratedImage": ("gemini_webapi.types.image", "GeneratedImage"),
+    "GeneratedVideo": ("gemini_webapi.types.video", "GeneratedVideo"),
+    "Image": ("gemini_webapi.types.image", "Image"),
+    "ModelOutput": ("gemini_webapi.types.modeloutput", "ModelOutput"),
+    "RPCData": ("gemini_webapi.types.grpc", "RPCData"),
+    "WebImage": ("gemini_webapi.types.image", "WebImage"),
+}
 
 __all__ = [
     "Candidate",
@@ -16,3 +33,18 @@ __all__ = [
     "RPCData",
     "WebImage",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    obj = getattr(import_module(module_name), attr)
+    setattr(sys.modules[__name__], name, obj)
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -1,12 +1,13 @@
-import html
-
-from pydantic import BaseModel, Field, field_validator
+import sys
+from dataclasses import dataclass, field
+from html import unescape as _unescape
 
 from .image import GeneratedImage, Image, WebImage
 from .video import GeneratedVideo
 
 
-class Candidate(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Candidate:
     """
     A single reply candidate object in the model output. A full response from Gemini usually contains multiple reply candidates.
 
@@ -31,25 +32,32 @@ class Candidate(BaseModel):
     text_delta: str | None = None
     thoughts: str | None = None
     thoughts_delta: str | None = None
-    web_images: list[WebImage] = Field(default_factory=list)
-    generated_images: list[GeneratedImage] = Field(default_factory=list)
-    generated_videos: list[GeneratedVideo] = Field(default_factory=list)
+    web_images: list[WebImage] = field(default_factory=list)
+    generated_images: list[GeneratedImage] = field(default_factory=list)
+    generated_videos: list[GeneratedVideo] = field(default_factory=list)
 
     def __str__(self):
         return self.text
 
     def __repr__(self):
-        return f"Candidate(rcid='{self.rcid}', text='{(len(self.text) <= 20 and self.text) or self.text[:20] + '...'}', images={self.images})"
+        text = self.text if len(self.text) <= 20 else f"{self.text[:20]}..."
+        return f"Candidate(rcid='{self.rcid}', text='{text}', images={self.images})"
+
+    def __post_init__(self):
+        # The candidate ID repeats across every chunk of a streamed response
+        self.rcid = sys.intern(self.rcid)
+        self.text = self._decode_html(self.text)
+        self.thoughts = self._decode_html(self.thoughts)
 
-    @field_validator("text", "thoughts", mode="after")
-    @classmethod
-    def decode_html(cls, value: str | None) -> str | None:
+    @staticmethod
+    def _decode_html(value: str | None) -> str | None:
         """
         Auto unescape HTML entities in text/thoughts if any.
         """
 
-        if value:
-            value = html.unescape(value)
+        # Most responses carry no entities at all; skip the unescape scan unless one could be present
+        if value and "&" in value:
+            value = _unescape(value)
         return value
 
     @property
@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class Gem(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Gem:
     """
     Reusable Gemini Gem object working as a system prompt, providing additional context to the model.
     Gemini provides a set of predefined gems, and users can create custom gems as well.
@@ -34,8 +35,69 @@ class GemJar(dict[str, Gem]):
     """
     Helper class for handling a collection of `Gem` objects, stored by their ID.
     This class extends `dict` to allows retrieving gems with extra filtering options.
+
+    Lookup indexes used by `filter` are built lazily and dropped whenever the jar is modified
+    through the dict interface. Mutating a `Gem` in place (e.g. renaming it) is not tracked.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pred_cache: dict[bool, GemJar] = {}
+        self._by_name: dict[str, list[str]] | None = None
+
+    def _invalidate(self) -> None:
+        # Reassign rather than clear: unpickling calls __setitem__ before __init__-set attributes exist
+        self._pred_cache = {}
+        self._by_name = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._invalidate()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._invalidate()
+        return result
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._invalidate()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._invalidate()
+        return result
+
+    def clear(self):
+        super().clear()
+        self._invalidate()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._invalidate()
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._invalidate()
+        return result
+
+    def _name_index(self) -> dict[str, list[str]]:
+        """
+        Map each gem name to the ids of the gems carrying it, in insertion order.
+        """
+
+        if self._by_name is None:
+            by_name: dict[str, list[str]] = {}
+            for gem_id, gem in self.items():
+                by_name.setdefault(gem.name, []).append(gem_id)
+            self._by_name = by_name
+        return self._by_name
+
     def __iter__(self):
         """
         Iter over the gems in the jar.
@@ -48,7 +110,7 @@ class GemJar(dict[str, Gem]):
         Retrieves a gem by its id and/or name.
         If both gem_id and name are provided, returns the gem that matches both.
         If only gem_id is provided, it's a direct lookup.
-        If only name is provided, it searches through the gems.
+        If only name is provided, it is looked up in a lazily built name index.
 
         Parameters
         ----------
@@ -80,11 +142,9 @@ class GemJar(dict[str, Gem]):
                 return gem_candidate
             return default
 
-        # name is not None (gem_id is None)
-        for gem_obj in self.values():
-            if gem_obj.name == name:
-                return gem_obj
-        return default
+        # name is not None (gem_id is None); the first gem inserted with this name wins
+        gem_ids = self._name_index().get(name)
+        return self[gem_ids[0]] if gem_ids else default
 
     def filter(self, predefined: bool | None = None, name: str | None = None) -> "GemJar":
         """
@@ -103,6 +163,16 @@ class GemJar(dict[str, Gem]):
             A new `GemJar` containing the filtered gems. Can be empty if no gems match the criteria.
         """
 
+        if name is None and predefined is not None:
+            cached = self._pred_cache.get(predefined)
+            if cached is None:
+                cached = self._pred_cache[predefined] = GemJar((gem_id, gem) for gem_id, gem in self.items() if gem.predefined == predefined)
+            # Hand out a copy so callers can't modify the cached view
+            return GemJar(cached)
+
+        if name is not None and predefined is None:
+            return GemJar((gem_id, self[gem_id]) for gem_id in self._name_index().get(name, ()))
+
         filtered_gems = GemJar()
 
         for gem_id, gem in self.items():
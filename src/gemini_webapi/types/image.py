@@ -1,12 +1,66 @@
+import asyncio
+import hashlib
+import os
 import re
+import secrets
+import shutil
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
 from curl_cffi import CurlHttpVersion
-from curl_cffi.requests import AsyncSession, Cookies
+from curl_cffi.requests import AsyncSession, Cookies, Response
 from pydantic import BaseModel, ConfigDict, field_validator
 
 from ..utils import logger
+from ..utils.download_cookies import make_cookie
+from ..utils.http_redirect import follow_text_redirects
+
+_FILENAME_RE = re.compile(r"(.*\.\w+)")
+# First hop of the generated image redirect chain, which always points at the same path on lh3.google.com
+_GG_SHORTCUT_RE = re.compile(r"^(https://lh3\.)googleusercontent\.com/gg/")
+
+# Image-specific headers that match browser behavior
+_IMAGE_HEADERS = MappingProxyType(
+    {
+        "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
+        "Origin": "https://gemini.google.com",
+        "Referer": "https://gemini.google.com/",
+        "Sec-Fetch-Dest": "empty",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Site": "cross-site",
+    }
+)
+
+# Save directories already created in this process, resolved and keyed by working directory and requested path
+_MKDIR_CACHE: dict[tuple[Path, str], Path] = {}
+
+
+def _save_dir(path: str | os.PathLike, refresh: bool = False) -> Path:
+    """
+    Return `path` as a resolved directory, creating it the first time it's used.
+    Saves into the same directory then skip the mkdir and resolve syscalls.
+    """
+
+    key = (Path.cwd(), os.fspath(path))
+    directory = None if refresh else _MKDIR_CACHE.get(key)
+    if directory is None:
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        directory = _MKDIR_CACHE[key] = directory.resolve()
+    return directory
+
+
+def _image_cache_path(download_url: str) -> Path | None:
+    """
+    Return where a downloaded copy of `download_url` is cached, or None if the image cache is disabled.
+    The cache is opt-in, set the GEMINI_IMAGE_CACHE_PATH environment variable to a writable directory to enable it.
+    """
+
+    cache_dir = os.getenv("GEMINI_IMAGE_CACHE_PATH")
+    if not cache_dir:
+        return None
+    return _save_dir(cache_dir) / hashlib.blake2b(download_url.encode(), digest_size=16).hexdigest()
 
 
 class HTTPError(Exception):
@@ -42,7 +96,8 @@ class Image(BaseModel):
     session_kwargs: dict = {}
 
     def __str__(self):
-        return f"Image(title='{self.title}', alt='{self.alt}', url='{(len(self.url) <= 20 and self.url) or self.url[:8] + '...' + self.url[-12:]}')"
+        url = self.url if len(self.url) <= 20 else f"{self.url[:8]}...{self.url[-12:]}"
+        return f"Image(title='{self.title}', alt='{self.alt}', url='{url}')"
 
     async def save(
         self,
@@ -51,6 +106,7 @@ class Image(BaseModel):
         cookies: dict | Cookies | None = None,
         verbose: bool = False,
         skip_invalid_filename: bool = False,
+        client: AsyncSession | None = None,
     ) -> str | None:
         """
         Save the image to disk.
@@ -67,6 +123,9 @@ class Image(BaseModel):
             If True, will print the path of the saved file or warning for invalid file name, by default False.
         skip_invalid_filename: `bool`, optional
             If True, will only save the image if the file name and extension are valid, by default False.
+        client: `curl_cffi.requests.AsyncSession`, optional
+            An open session to download with instead of creating a new one, e.g. `GeminiClient.client`, so its
+            warm connections are reused. Image headers and cookies are sent per request. The session is not closed.
 
         Returns
         -------
@@ -77,10 +136,116 @@ class Image(BaseModel):
         ------
         `HTTPError`
             If the network request failed.
+        `TypeError`
+            If `cookies` is neither a dict nor a `curl_cffi.requests.Cookies` object.
+        """
+
+        return await self._save(path, filename, cookies, verbose, skip_invalid_filename, client)
+
+    @classmethod
+    async def save_many(
+        cls,
+        images: list["Image"],
+        path: str = "temp",
+        cookies: dict | Cookies | None = None,
+        verbose: bool = False,
+        skip_invalid_filename: bool = False,
+        concurrency: int = 8,
+        client: AsyncSession | None = None,
+    ) -> list[str | None]:
         """
+        Save multiple images to disk concurrently over a single shared HTTP session.
 
-        filename = filename or self.url.split("/")[-1].split("?")[0]
-        match = re.search(r"^(.*\.\w+)", filename)
+        Parameters
+        ----------
+        images: `list[Image]`
+            Images to save. Proxy and session settings are taken from the first image, so the images
+            should come from the same client (e.g. `ModelOutput.images`).
+        path: `str`, optional
+            Path to save the images, by default will save to "./temp".
+        cookies: `dict`, optional
+            Cookies used for requesting the content of the images. If not provided, will use the cookies
+            of the first generated image in the list, if any.
+        verbose : `bool`, optional
+            If True, will print the path of each saved file or warning for invalid file names, by default False.
+        skip_invalid_filename: `bool`, optional
+            If True, will only save images whose file name and extension are valid, by default False.
+        concurrency: `int`, optional
+            Maximum number of images downloaded at the same time, by default 8.
+        client: `curl_cffi.requests.AsyncSession`, optional
+            An open session to download with instead of creating a new one, see `Image.save`.
+
+        Returns
+        -------
+        `list[str | None]`
+            Absolute paths of the saved images in the same order as `images`, None for skipped ones.
+
+        Raises
+        ------
+        `HTTPError`
+            If any of the network requests failed.
+        `TypeError`
+            If `cookies` is neither a dict nor a `curl_cffi.requests.Cookies` object.
+        """
+
+        if not images:
+            return []
+
+        if cookies is None:
+            cookies = next((image_cookies for image in images if (image_cookies := getattr(image, "cookies", None))), None)
+
+        semaphore = asyncio.Semaphore(concurrency)
+        download_cookies = cls._build_download_cookies(cookies)
+
+        async def _save_all(session: AsyncSession, **request_kwargs) -> list[str | None]:
+            async def _save_one(image: Image) -> str | None:
+                target = image._resolve_target(None, verbose, skip_invalid_filename)
+                if target is None:
+                    return None
+                async with semaphore:
+                    return await image._download(session, *target, path, verbose, **request_kwargs)
+
+            return list(await asyncio.gather(*(_save_one(image) for image in images)))
+
+        if client is not None:
+            return await _save_all(client, headers=_IMAGE_HEADERS, cookies=download_cookies)
+
+        # Size the pool to the batch so concurrent downloads don't wait for a free curl handle
+        async with images[0]._open_session(download_cookies, max_clients=max(concurrency, 10)) as session:
+            return await _save_all(session)
+
+    async def _save(
+        self,
+        path: str,
+        filename: str | None,
+        cookies: dict | Cookies | None,
+        verbose: bool,
+        skip_invalid_filename: bool,
+        client: AsyncSession | None,
+        **target_kwargs,
+    ) -> str | None:
+        """
+        Resolve the download target and fetch it, either through `client` or a dedicated session.
+        """
+
+        target = self._resolve_target(filename, verbose, skip_invalid_filename, **target_kwargs)
+        if target is None:
+            return None
+
+        download_cookies = self._build_download_cookies(cookies)
+        if client is not None:
+            return await self._download(client, *target, path, verbose, headers=_IMAGE_HEADERS, cookies=download_cookies)
+
+        async with self._open_session(download_cookies) as session:
+            return await self._download(session, *target, path, verbose)
+
+    def _resolve_target(self, filename: str | None, verbose: bool, skip_invalid_filename: bool) -> tuple[str, str] | None:
+        """
+        Return the URL to download and the file name to save it as, or None if the image should be skipped.
+        """
+
+        filename = filename or self.url.rsplit("/", 1)[-1].split("?", 1)[0]
+        match = _FILENAME_RE.match(filename)
         if match:
             filename = match.group()
         else:
@@ -89,16 +254,13 @@ class Image(BaseModel):
             if skip_invalid_filename:
                 return None
 
-        # Use image-specific headers that match browser behavior
-        headers = {
-            "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-            "Origin": "https://gemini.google.com",
-            "Referer": "https://gemini.google.com/",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "cross-site",
-        }
-        download_url = self.url
+        return self.url, filename
+
+    @staticmethod
+    def _build_download_cookies(cookies: dict | Cookies | None) -> Cookies:
+        """
+        Build the cookie jar used for image downloads.
+        """
 
         # Copy cookies with additional domains for Google image CDN
         # Cookies are needed for the intermediate redirect to lh3.google.com
@@ -107,76 +269,124 @@ class Image(BaseModel):
             if isinstance(cookies, dict):
                 # Dict cookies - set for google.com (covers lh3.google.com)
                 for name, value in cookies.items():
-                    download_cookies.set(name, value, domain=".google.com")
-            elif hasattr(cookies, "jar"):
-                # Cookies object with jar attribute
-                for cookie in cookies.jar:
-                    if cookie.value is not None:
-                        download_cookies.set(cookie.name, cookie.value, domain=cookie.domain)
+                    download_cookies.jar.set_cookie(make_cookie(name, value, ".google.com"))
+            elif isinstance(cookies, Cookies):
+                # Copy the jar's cookie objects directly instead of re-setting them one by one
+                download_cookies = Cookies(cookies)
             else:
-                # Assume it's already a Cookies object, copy it
-                download_cookies = cookies
+                raise TypeError(f"cookies must be a dict or curl_cffi.requests.Cookies, got {type(cookies).__name__}")
 
-        async with AsyncSession(
+        return download_cookies
+
+    def _open_session(self, download_cookies: Cookies, max_clients: int = 10) -> AsyncSession:
+        """
+        Create an HTTP session set up with image download headers and the given cookie jar.
+        `max_clients` sizes the session's connection pool, unless overridden by `session_kwargs`.
+        """
+
+        client = AsyncSession(
             proxy=self.proxy,
             allow_redirects=True,
             impersonate="chrome",
             http_version=CurlHttpVersion.V2_0,
-            **self.session_kwargs,
-        ) as client:
-            client.headers.update(headers)
-            client.cookies = download_cookies
-            # Google uses text-based redirects where the response body contains the next URL
-            # The redirect chain is:
-            # 1. lh3.googleusercontent.com/gg/... -> text/plain body with redirect URL (no cookies needed)
-            # 2. lh3.google.com/rd-gg/... -> text/plain body with redirect URL (COOKIES NEEDED!)
-            # 3. lh3.googleusercontent.com/rd-gg/... -> actual image (no cookies needed)
-            current_url = download_url
-            max_redirects = 5
-            response = None
-
-            for hop in range(max_redirects):
-                logger.debug(f"Image download hop {hop + 1}: {current_url[:80]}...")
-                response = await client.get(current_url)
-                logger.debug(f"  Status: {response.status_code}, Content-Type: {response.headers.get('content-type', 'N/A')}")
-
-                if response.status_code != 200:
-                    logger.debug(f"  Non-200 response, body: {response.text[:200] if response.text else 'N/A'}")
-                    break
-
-                content_type = response.headers.get("content-type", "")
-
-                # If we got an image, we're done
-                if "image" in content_type:
-                    logger.debug(f"  Got image, size: {len(response.content)} bytes")
-                    break
-
-                # If we got text/plain, the body contains the redirect URL
-                if content_type.startswith("text/plain"):
-                    new_url = response.text.strip()
-                    logger.debug(f"  Text redirect to: {new_url[:80]}...")
-                    if new_url.startswith("http"):
-                        current_url = new_url
-                        continue
-
-                # Unknown content type, stop
-                logger.debug("  Unknown content type, stopping")
-                break
-
-            if response is not None and response.status_code == 200 and "image" in response.headers.get("content-type", ""):
-                dest_path = Path(path)
-                dest_path.mkdir(parents=True, exist_ok=True)
-
-                dest = dest_path / filename
-                dest.write_bytes(response.content)
-
-                if verbose:
-                    logger.info(f"Image saved as {dest.resolve()}")
-
-                return str(dest.resolve())
-            else:
-                reason = getattr(response, "reason_phrase", None) or getattr(response, "reason", "") or ""
-                raise HTTPError(f"Error downloading image: {response.status_code if response else 'No response'} {reason}")
+            **{"max_clients": max_clients, **self.session_kwargs},
+        )
+        client.headers.update(_IMAGE_HEADERS)
+        client.cookies = download_cookies
+        return client
+
+    async def _download(self, client: AsyncSession, download_url: str, filename: str, path: str, verbose: bool, **request_kwargs) -> str:
+        """
+        Follow Google's redirect chain for `download_url` with `client` and write the image to `path`.
+        Extra `request_kwargs` (e.g. headers and cookies for a shared session) are passed to every request.
+        """
+
+        # Google uses text-based redirects where the response body contains the next URL
+        # The redirect chain is:
+        # 1. lh3.googleusercontent.com/gg/... -> text/plain body with redirect URL (no cookies needed)
+        # 2. lh3.google.com/rd-gg/... -> text/plain body with redirect URL (COOKIES NEEDED!)
+        # 3. lh3.googleusercontent.com/rd-gg/... -> actual image (no cookies needed)
+        # Hop 1 only maps /gg/ to /rd-gg/ on lh3.google.com, so start from hop 2 directly
+        # and keep the original URL to walk the full chain if the shortcut doesn't work
+        current_url = download_url
+        fallback_url = None
+        shortcut_url = _GG_SHORTCUT_RE.sub(r"\1google.com/rd-gg/", download_url, count=1)
+        if shortcut_url != download_url:
+            current_url, fallback_url = shortcut_url, download_url
+
+        # A cached copy of the same URL turns the whole download into a local file copy
+        cache_path = _image_cache_path(download_url)
+        if cache_path is not None and cache_path.is_file():
+            logger.debug("  Cache hit: {}", cache_path)
+            dest = _save_dir(path) / filename
+            try:
+                shutil.copyfile(cache_path, dest)
+            except FileNotFoundError:
+                # The directory was removed after it was cached, create it again
+                dest = _save_dir(path, refresh=True) / filename
+                shutil.copyfile(cache_path, dest)
+
+            if verbose:
+                logger.info(f"Image saved as {dest}")
+
+            return str(dest)
+
+        response, found = await follow_text_redirects(client, current_url, "image/", fallback_url=fallback_url, **request_kwargs)
+        if found:
+            saved = await self._write_stream(response, path, filename, verbose)
+            if cache_path is not None:
+                self._store_in_cache(saved, cache_path)
+            return saved
+
+        raise HTTPError(f"Error downloading image: {response.status_code} {response.reason}")
+
+    @staticmethod
+    async def _write_stream(response: Response, path: str, filename: str, verbose: bool) -> str:
+        """
+        Write a streamed image response to `path`/`filename` chunk by chunk.
+        """
+
+        dest = _save_dir(path) / filename
+        try:
+            f = dest.open("wb")
+        except FileNotFoundError:
+            # The directory was removed after it was cached, create it again
+            dest = _save_dir(path, refresh=True) / filename
+            f = dest.open("wb")
+
+        size = 0
+        try:
+            with f:
+                async for chunk in response.aiter_content():
+                    f.write(chunk)
+                    size += len(chunk)
+        except BaseException:
+            # Don't leave a truncated file behind
+            dest.unlink(missing_ok=True)
+            raise
+
+        logger.debug("  Got image, size: {} bytes", size)
+
+        if verbose:
+            logger.info(f"Image saved as {dest}")
+
+        return str(dest)
+
+    @staticmethod
+    def _store_in_cache(saved: str, cache_path: Path) -> None:
+        """
+        Copy a saved image into the image cache. Failures only cost the cache entry.
+        """
+
+        # Files are copied rather than hard-linked, so editing a saved image never alters the cached copy.
+        # The copy goes through a temporary name so concurrent saves never expose a partial entry.
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            shutil.copyfile(saved, tmp_path)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to cache image {saved}: {e}")
+            tmp_path.unlink(missing_ok=True)
 
 
 class WebImage(Image):
@@ -219,6 +429,7 @@ class GeneratedImage(Image):
         verbose: bool = False,
         skip_invalid_filename: bool = False,
         full_size: bool = True,
+        client: AsyncSession | None = None,
     ) -> str | None:
         """
         Save the image to disk.
@@ -238,6 +449,8 @@ class GeneratedImage(Image):
             If True, will only save the image if the file name and extension are valid, by default False.
         full_size: `bool`, optional
             If True, will modify the default preview (512*512) URL to get the full size image, by default True.
+        client: `curl_cffi.requests.AsyncSession`, optional
+            An open session to download with instead of creating a new one, see `Image.save`.
 
         Returns
         -------
@@ -245,19 +458,24 @@ class GeneratedImage(Image):
             Absolute path of the saved image if successfully saved.
         """
 
-        # Build URL with size suffix and authuser parameter for multi-account support
-        url_suffix = "=s2048" if full_size else ""
-        self.url += url_suffix
+        return await self._save(path, filename, cookies or self.cookies, verbose, skip_invalid_filename, client, full_size=full_size)
+
+    # @override
+    def _resolve_target(self, filename: str | None, verbose: bool, skip_invalid_filename: bool, full_size: bool = True) -> tuple[str, str] | None:
+        # Build URL with size suffix and authuser parameter for multi-account support.
+        # Kept local so saving the same image twice doesn't keep appending to self.url.
+        download_url = self.url + "=s2048" if full_size else self.url
 
         # Add authuser parameter for multi-account support
         if self.account_index > 0:
-            separator = "&" if "?" in self.url else "?"
-            self.url += f"{separator}authuser={self.account_index}"
-
-        return await super().save(
-            path=path,
-            filename=filename or f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{self.url[-10:]}.png",
-            cookies=cookies or self.cookies,
-            verbose=verbose,
-            skip_invalid_filename=skip_invalid_filename,
+            separator = "&" if "?" in download_url else "?"
+            download_url += f"{separator}authuser={self.account_index}"
+
+        target = super()._resolve_target(
+            filename or f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{download_url[-10:]}.png",
+            verbose,
+            skip_invalid_filename,
         )
+        if target is None:
+            return None
+        return download_url, target[1]
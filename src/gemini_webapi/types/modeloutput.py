@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import Any
+
+from pydantic import BaseModel, PrivateAttr
 
 from .candidate import Candidate
 from .image import Image
@@ -24,36 +26,55 @@ class ModelOutput(BaseModel):
     candidates: list[Candidate]
     chosen: int = 0
 
+    _chosen_candidate: Candidate | None = PrivateAttr(default=None)
+
     def __str__(self):
         return self.text
 
     def __repr__(self):
         return f"ModelOutput(metadata={self.metadata}, chosen={self.chosen}, candidates={self.candidates})"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # drop the cached candidate when the selection changes
+        if name in ("chosen", "candidates"):
+            self._chosen_candidate = None
+
+    @property
+    def candidate(self) -> Candidate:
+        """
+        The chosen candidate, looked up once and reused by the other properties.
+        """
+
+        candidate = self._chosen_candidate
+        if candidate is None:
+            candidate = self._chosen_candidate = self.candidates[self.chosen]
+        return candidate
+
     @property
     def text(self) -> str:
-        return self.candidates[self.chosen].text
+        return self.candidate.text
 
     @property
     def text_delta(self) -> str:
-        return self.candidates[self.chosen].text_delta or ""
+        return self.candidate.text_delta or ""
 
     @property
     def thoughts(self) -> str | None:
-        return self.candidates[self.chosen].thoughts
+        return self.candidate.thoughts
 
     @property
     def thoughts_delta(self) -> str:
-        return self.candidates[self.chosen].thoughts_delta or ""
+        return self.candidate.thoughts_delta or ""
 
     @property
     def images(self) -> list[Image]:
-        return self.candidates[self.chosen].images
+        return self.candidate.images
 
     @property
     def videos(self) -> list[GeneratedVideo]:
-        return self.candidates[self.chosen].videos
+        return self.candidate.videos
 
     @property
     def rcid(self) -> str:
-        return self.candidates[self.chosen].rcid
+        return self.candidate.rcid
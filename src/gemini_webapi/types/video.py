@@ -1,11 +1,21 @@
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
 from curl_cffi import CurlHttpVersion
 from curl_cffi.requests import AsyncSession, Cookies
 from pydantic import BaseModel, ConfigDict, field_validator
 
 from ..utils import logger
+from ..utils.download_cookies import make_cookie
+from ..utils.http_redirect import follow_text_redirects
+
+_VIDEO_HEADERS = MappingProxyType(
+    {
+        "Origin": "https://gemini.google.com",
+        "Referer": "https://gemini.google.com/",
+    }
+)
 
 
 class HTTPError(Exception):
@@ -55,7 +65,33 @@ class GeneratedVideo(BaseModel):
         return v
 
     def __str__(self):
-        return f"GeneratedVideo(title='{self.title}', url='{(len(self.url) <= 40 and self.url) or self.url[:20] + '...' + self.url[-20:]}')"
+        url = self.url if len(self.url) <= 40 else f"{self.url[:20]}...{self.url[-20:]}"
+        return f"GeneratedVideo(title='{self.title}', url='{url}')"
+
+    @staticmethod
+    def _build_download_cookies(cookies: dict | Cookies | None) -> Cookies:
+        """
+        Build the cookie jar used for video and thumbnail downloads.
+        """
+
+        # Copy cookies with additional domains for Google video CDN
+        download_cookies = Cookies()
+        if cookies:
+            if isinstance(cookies, dict):
+                # Dict cookies - set for both google.com and usercontent.google.com
+                for name, value in cookies.items():
+                    download_cookies.jar.set_cookie(make_cookie(name, value, ".google.com"))
+                    download_cookies.jar.set_cookie(make_cookie(name, value, ".usercontent.google.com"))
+            elif isinstance(cookies, Cookies):
+                # Copy the jar's cookie objects as-is, then only add the extra usercontent domain entries
+                download_cookies = Cookies(cookies)
+                for cookie in cookies.jar:
+                    if cookie.domain and "google.com" in cookie.domain:
+                        download_cookies.jar.set_cookie(make_cookie(cookie.name, cookie.value, ".usercontent.google.com"))
+            else:
+                raise TypeError(f"cookies must be a dict or curl_cffi.requests.Cookies, got {type(cookies).__name__}")
+
+        return download_cookies
 
     async def save(
         self,
@@ -87,6 +123,8 @@ class GeneratedVideo(BaseModel):
         ------
         `HTTPError`
             If the network request failed.
+        `TypeError`
+            If `cookies` is neither a dict nor a `curl_cffi.requests.Cookies` object.
         """
 
         # Generate a default filename if not provided
@@ -97,11 +135,6 @@ class GeneratedVideo(BaseModel):
         if not filename.endswith(".mp4"):
             filename += ".mp4"
 
-        headers = {
-            "Origin": "https://gemini.google.com",
-            "Referer": "https://gemini.google.com/",
-        }
-
         # Add authuser param for Google video URLs (for multi-account support)
         download_url = self.url
         if "usercontent.google.com" in download_url and "authuser" not in download_url:
@@ -110,24 +143,7 @@ class GeneratedVideo(BaseModel):
             else:
                 download_url += f"?authuser={self.account_index}"
 
-        # Copy cookies with additional domains for Google video CDN
-        download_cookies = Cookies()
-        actual_cookies = cookies or self.cookies
-        if actual_cookies:
-            if isinstance(actual_cookies, dict):
-                # Dict cookies - set for both google.com and usercontent.google.com
-                for name, value in actual_cookies.items():
-                    download_cookies.set(name, value, domain=".google.com")
-                    download_cookies.set(name, value, domain=".usercontent.google.com")
-            elif hasattr(actual_cookies, "jar"):
-                # Cookies object with jar attribute
-                for cookie in actual_cookies.jar:
-                    download_cookies.set(cookie.name, cookie.value, domain=cookie.domain)
-                    if cookie.domain and "google.com" in cookie.domain:
-                        download_cookies.set(cookie.name, cookie.value, domain=".usercontent.google.com")
-            else:
-                # Assume it's already a Cookies object, copy it
-                download_cookies = actual_cookies
+        download_cookies = self._build_download_cookies(cookies or self.cookies)
 
         async with AsyncSession(
             proxy=self.proxy,
@@ -136,13 +152,13 @@ class GeneratedVideo(BaseModel):
             http_version=CurlHttpVersion.V2_0,
             **self.session_kwargs,
         ) as client:
-            client.headers.update(headers)
+            client.headers.update(_VIDEO_HEADERS)
             client.cookies = download_cookies
             response = await client.get(download_url)
 
             if response.status_code == 200:
                 content_type = response.headers.get("content-type", "")
-                if "video" in content_type or "octet-stream" in content_type:
+                if content_type.startswith(("video/", "application/octet-stream")):
                     path = Path(path)
                     path.mkdir(parents=True, exist_ok=True)
 
@@ -156,8 +172,7 @@ class GeneratedVideo(BaseModel):
                 else:
                     logger.warning(f"Content type of {filename} is not video, but {content_type}.")
 
-            reason = getattr(response, "reason_phrase", None) or getattr(response, "reason", "") or ""
-            raise HTTPError(f"Error downloading video: {response.status_code} {reason}")
+            raise HTTPError(f"Error downloading video: {response.status_code} {response.reason}")
 
     async def save_thumbnail(
         self,
@@ -189,6 +204,8 @@ class GeneratedVideo(BaseModel):
         ------
         `HTTPError`
             If the network request failed or no thumbnail URL available.
+        `TypeError`
+            If `cookies` is neither a dict nor a `curl_cffi.requests.Cookies` object.
         """
 
         if not self.thumbnail_url:
@@ -198,26 +215,7 @@ class GeneratedVideo(BaseModel):
         if not filename:
             filename = f"{datetime.now().strftime('%Y%m%d%H%M%S')}_thumb.jpg"
 
-        headers = {
-            "Origin": "https://gemini.google.com",
-            "Referer": "https://gemini.google.com/",
-        }
-
-        # Copy cookies with additional domains
-        download_cookies = Cookies()
-        actual_cookies = cookies or self.cookies
-        if actual_cookies:
-            if isinstance(actual_cookies, dict):
-                for name, value in actual_cookies.items():
-                    download_cookies.set(name, value, domain=".google.com")
-                    download_cookies.set(name, value, domain=".usercontent.google.com")
-            elif hasattr(actual_cookies, "jar"):
-                for cookie in actual_cookies.jar:
-                    download_cookies.set(cookie.name, cookie.value, domain=cookie.domain)
-                    if cookie.domain and "google.com" in cookie.domain:
-                        download_cookies.set(cookie.name, cookie.value, domain=".usercontent.google.com")
-            else:
-                download_cookies = actual_cookies
+        download_cookies = self._build_download_cookies(cookies or self.cookies)
 
         async with AsyncSession(
             proxy=self.proxy,
@@ -226,40 +224,22 @@ class GeneratedVideo(BaseModel):
             http_version=CurlHttpVersion.V2_0,
             **self.session_kwargs,
         ) as client:
-            client.headers.update(headers)
+            client.headers.update(_VIDEO_HEADERS)
             client.cookies = download_cookies
 
             # Follow text-based redirect chain
-            current_url = self.thumbnail_url
-            max_redirects = 5
-            response = None
-            for _ in range(max_redirects):
-                response = await client.get(current_url)
-                if response.status_code != 200:
-                    break
-                content_type = response.headers.get("content-type", "")
-                if "image" in content_type:
-                    break
-                if content_type.startswith("text/plain"):
-                    new_url = response.text.strip()
-                    if new_url.startswith("http"):
-                        current_url = new_url
-                    else:
-                        break
-                else:
-                    break
+            response, found = await follow_text_redirects(client, self.thumbnail_url, "image/")
 
-            if response is not None and response.status_code == 200 and "image" in response.headers.get("content-type", ""):
+            if found:
                 path = Path(path)
                 path.mkdir(parents=True, exist_ok=True)
 
                 dest = path / filename
-                dest.write_bytes(response.content)
+                dest.write_bytes(await response.acontent())
 
                 if verbose:
                     logger.info(f"Thumbnail saved as {dest.resolve()}")
 
                 return str(dest.resolve())
             else:
-                reason = getattr(response, "reason_phrase", None) or getattr(response, "reason", "") or ""
-                raise HTTPError(f"Error downloading thumbnail: {response.status_code} {reason}")
+                raise HTTPError(f"Error downloading thumbnail: {response.status_code} {response.reason}")
@@ -14,9 +14,10 @@ from .parsing import (
     parse_response_by_frame,
 )
 from .rotate_1psidts import rotate_1psidts
-from .upload_file import parse_file_name, upload_file
+from .upload_file import close_upload_sessions, parse_file_name, upload_file, upload_files
 
 __all__ = [
+    "close_upload_sessions",
     "extract_json_from_response",
     "get_access_token",
     "get_delta_by_fp_len",
@@ -32,4 +33,5 @@ __all__ = [
     "running",
     "set_log_level",
     "upload_file",
+    "upload_files",
 ]
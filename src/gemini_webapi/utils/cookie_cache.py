@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from curl_cffi.requests import Cookies
+
+# Rotated __Secure-1PSIDTS values are cached in files named .cached_1psidts_<__Secure-1PSID>.txt
+CACHE_FILE_PREFIX = ".cached_1psidts_"
+CACHE_FILE_SUFFIX = ".txt"
+# Rotated values are reused for this long to avoid 429 Too Many Requests
+CACHE_MAX_AGE = 60
+
+# In-process layer in front of the cache files: __Secure-1PSID -> (expiry timestamp, __Secure-1PSIDTS)
+_MEM_CACHE: dict[str, tuple[float, str]] = {}
+
+
+def get_secure_1psid(cookies: dict | Cookies) -> str | None:
+    """Safely extract __Secure-1PSID from cookies, preferring .google.com domain."""
+    from curl_cffi.requests import Cookies
+
+    if isinstance(cookies, Cookies):
+        return cookies.get("__Secure-1PSID", domain=".google.com") or cookies.get("__Secure-1PSID")
+    return cookies.get("__Secure-1PSID")
+
+
+def get_cache_dir() -> Path:
+    """Get the cache directory for cookie storage."""
+    return _resolve_cache_dir(os.getenv("GEMINI_COOKIE_PATH"))
+
+
+@lru_cache(maxsize=8)
+def _resolve_cache_dir(gemini_cookie_path: str | None) -> Path:
+    """Build the cache directory path once per GEMINI_COOKIE_PATH value."""
+    if gemini_cookie_path:
+        return Path(gemini_cookie_path)
+    return Path(__file__).parent / "temp"
+
+
+def get_cache_file(secure_1psid: str, cache_dir: Path | None = None) -> Path:
+    """Get the path of the cache file holding the __Secure-1PSIDTS value for `secure_1psid`."""
+    return (cache_dir or get_cache_dir()) / f"{CACHE_FILE_PREFIX}{secure_1psid}{CACHE_FILE_SUFFIX}"
+
+
+def list_cache_files(cache_dir: Path | None = None) -> list[tuple[str, Path]]:
+    """
+    List (__Secure-1PSID, cache file) pairs for every cache file in `cache_dir`.
+
+    A single directory scan, entry names and types come from the listing without a stat per file.
+    """
+
+    prefix_len, suffix_len = len(CACHE_FILE_PREFIX), len(CACHE_FILE_SUFFIX)
+    try:
+        with os.scandir(cache_dir or get_cache_dir()) as it:
+            return [(entry.name[prefix_len:-suffix_len], Path(entry.path)) for entry in it if entry.name.startswith(CACHE_FILE_PREFIX) and entry.name.endswith(CACHE_FILE_SUFFIX) and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def read_cached_1psidts(cache_file: Path) -> str | None:
+    """Read a cached __Secure-1PSIDTS value regardless of its age, None if the file doesn't exist."""
+    try:
+        return cache_file.read_bytes().decode()
+    except FileNotFoundError:
+        return None
+
+
+def read_fresh_1psidts(secure_1psid: str) -> str | None:
+    """
+    Get the cached __Secure-1PSIDTS value for `secure_1psid` if it was rotated within `CACHE_MAX_AGE` seconds.
+
+    The in-process cache is checked first, the cache file (shared across processes and restarts) only when it's cold.
+    """
+
+    now = time.time()
+    entry = _MEM_CACHE.get(secure_1psid)
+    if entry and entry[0] >= now:
+        return entry[1]
+
+    cache_file = get_cache_file(secure_1psid)
+    try:
+        expiry = cache_file.stat().st_mtime + CACHE_MAX_AGE
+    except FileNotFoundError:
+        return None
+    if expiry < now:
+        return None
+
+    cached_1psidts = read_cached_1psidts(cache_file)
+    if cached_1psidts:
+        _MEM_CACHE[secure_1psid] = (expiry, cached_1psidts)
+    return cached_1psidts
+
+
+def write_cached_1psidts(secure_1psid: str, value: str) -> None:
+    """Store a freshly rotated __Secure-1PSIDTS value in both the in-process cache and its cache file."""
+    cache_file = get_cache_file(secure_1psid)
+
+    # The cache directory is only created when the first write finds it missing
+    try:
+        _write_private_file(cache_file, value)
+    except FileNotFoundError:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _write_private_file(cache_file, value)
+
+    _MEM_CACHE[secure_1psid] = (time.time() + CACHE_MAX_AGE, value)
+
+
+def _write_private_file(path: Path, value: str) -> None:
+    """
+    Write `value` to `path`, restricting a newly created file to owner read/write only.
+
+    The mode is applied by `os.open` at creation, and truncating an existing file keeps its mode, so no chmod is needed.
+    """
+
+    with os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+        f.write(value.encode())
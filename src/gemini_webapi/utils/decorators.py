@@ -10,11 +10,8 @@ DELAY_FACTOR = 5
 T = TypeVar("T")
 
 
-async def _ensure_client_running(client: Any, func_name: str) -> None:
-    """Ensure the client is initialized and running."""
-    if client._running:
-        return
-
+async def _start_client(client: Any, func_name: str) -> None:
+    """Initialize a client that isn't running, raising if it still isn't afterwards."""
     await client.init(
         timeout=client.timeout,
         auto_close=client.auto_close,
@@ -29,11 +26,6 @@ async def _ensure_client_running(client: Any, func_name: str) -> None:
         raise APIError(f"Invalid function call: GeminiClient.{func_name}. Client initialization failed.")
 
 
-def _calculate_retry_delay(retry_max: int, current_retry: int) -> float:
-    """Calculate exponential backoff delay for retries."""
-    return (retry_max - current_retry + 1) * DELAY_FACTOR
-
-
 def running(retry: int = 0) -> Callable:
     """
     Decorator to check if GeminiClient is running before making a request.
@@ -45,54 +37,60 @@ def running(retry: int = 0) -> Callable:
         Max number of retries when `gemini_webapi.APIError` is raised.
     """
 
+    # Backoff delay indexed by the number of retries remaining, growing linearly as retries are used up
+    delays = tuple((retry - remaining + 1) * DELAY_FACTOR for remaining in range(retry + 1))
+
     def decorator(func: Callable) -> Callable:
         if inspect.isasyncgenfunction(func):
-            return _wrap_async_generator(func, retry)
-        return _wrap_async_function(func, retry)
+            return _wrap_async_generator(func, delays)
+        return _wrap_async_function(func, delays)
 
     return decorator
 
 
-def _wrap_async_generator(func: Callable, retry_max: int) -> Callable:
+def _wrap_async_generator(func: Callable, delays: tuple[int, ...]) -> Callable:
     """Wrap an async generator function with retry logic."""
 
     @functools.wraps(func)
-    async def wrapper(client: Any, *args: Any, current_retry: int | None = None, **kwargs: Any) -> AsyncGenerator:
-        retries_remaining = retry_max if current_retry is None else current_retry
-
-        try:
-            await _ensure_client_running(client, func.__name__)
-            async for item in func(client, *args, **kwargs):
-                yield item
-        except APIError:
-            if retries_remaining <= 0:
-                raise
-
-            delay = _calculate_retry_delay(retry_max, retries_remaining)
-            await asyncio.sleep(delay)
-
-            async for item in wrapper(client, *args, current_retry=retries_remaining - 1, **kwargs):
-                yield item
+    async def wrapper(client: Any, *args: Any, **kwargs: Any) -> AsyncGenerator:
+        retries_remaining = len(delays) - 1
+
+        while True:
+            try:
+                # Checked inline so a running client doesn't pay for a coroutine on every call
+                if not client._running:
+                    await _start_client(client, func.__name__)
+                async for item in func(client, *args, **kwargs):
+                    yield item
+                return
+            except APIError:
+                if retries_remaining <= 0:
+                    raise
+
+                await asyncio.sleep(delays[retries_remaining])
+                retries_remaining -= 1
 
     return wrapper
 
 
-def _wrap_async_function(func: Callable, retry_max: int) -> Callable:
+def _wrap_async_function(func: Callable, delays: tuple[int, ...]) -> Callable:
     """Wrap a regular async function with retry logic."""
 
     @functools.wraps(func)
-    async def wrapper(client: Any, *args: Any, current_retry: int | None = None, **kwargs: Any) -> Any:
-        retries_remaining = retry_max if current_retry is None else current_retry
-
-        try:
-            await _ensure_client_running(client, func.__name__)
-            return await func(client, *args, **kwargs)
-        except APIError:
-            if retries_remaining <= 0:
-                raise
-
-            delay = _calculate_retry_delay(retry_max, retries_remaining)
-            await asyncio.sleep(delay)
-            return await wrapper(client, *args, current_retry=retries_remaining - 1, **kwargs)
+    async def wrapper(client: Any, *args: Any, **kwargs: Any) -> Any:
+        retries_remaining = len(delays) - 1
+
+        while True:
+            try:
+                # Checked inline so a running client doesn't pay for a coroutine on every call
+                if not client._running:
+                    await _start_client(client, func.__name__)
+                return await func(client, *args, **kwargs)
+            except APIError:
+                if retries_remaining <= 0:
+                    raise
+
+                await asyncio.sleep(delays[retries_remaining])
+                retries_remaining -= 1
 
     return wrapper
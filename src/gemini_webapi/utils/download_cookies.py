@@ -0,0 +1,40 @@
+from functools import lru_cache
+from http.cookiejar import Cookie
+
+
+@lru_cache(maxsize=128)
+def make_cookie(name: str, value: str, domain: str) -> Cookie:
+    """
+    Build a session cookie for `domain`, equivalent to what `curl_cffi.requests.Cookies.set` creates.
+
+    `Cookies.set` rebuilds the `Cookie` object (and warns about `__Secure-` prefixed names) on every call.
+    Media downloads and init attempts copy the same handful of cookies into fresh jars, so the objects are
+    built once per (name, value, domain) and shared between jars; cookie jars never mutate them.
+    Cookie name prefixes are handled like `Cookies.set` does: `__Secure-` cookies are made secure,
+    and `__Host-` cookies are made secure with the domain removed.
+    """
+
+    # Browsers reject prefixed cookies that break their rules, Cookies.set enforces the same
+    is_host = name.startswith("__Host-")
+    if is_host:
+        domain = ""
+
+    return Cookie(
+        version=0,
+        name=name,
+        value=value,
+        port=None,
+        port_specified=False,
+        domain=domain,
+        domain_specified=bool(domain),
+        domain_initial_dot=domain.startswith("."),
+        path="/",
+        path_specified=True,
+        secure=is_host or name.startswith("__Secure-"),
+        expires=None,
+        discard=True,
+        comment=None,
+        comment_url=None,
+        rest={"HttpOnly": None},
+        rfc2109=False,
+    )
@@ -1,16 +1,28 @@
+from __future__ import annotations
+
 import asyncio
-import os
 import re
-from asyncio import Task
+from collections.abc import Coroutine
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from curl_cffi import CurlHttpVersion
-from curl_cffi.requests import AsyncSession, Cookies, Response
-
-from ..constants import Endpoint, Headers
+from ..constants import GEMINI_HEADERS, Endpoint
 from ..exceptions import AuthError
+from .cookie_cache import get_cache_dir, get_cache_file, get_secure_1psid, list_cache_files, read_cached_1psidts
+from .download_cookies import make_cookie
 from .logger import logger
 
+# curl_cffi is imported where it's needed at runtime, so importing the package doesn't load its native extension
+if TYPE_CHECKING:
+    from curl_cffi.requests import AsyncSession, Cookies, Response
+
+# Token keys are located with bytes.find, then only the value right after the key is matched with a regex.
+# The value is matched as a JSON string body with character classes, which has no ambiguous lazy quantifier to backtrack over.
+# Both run on the raw response body, so the page is never decoded to str, only the matched tokens are.
+_TOKEN_VALUE_RE = re.compile(rb'\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+# Tokens are short, the value match never needs to look further than this past the key
+_TOKEN_VALUE_WINDOW = 2048
+
 
 async def send_request(
     cookies: dict | Cookies,
@@ -18,80 +30,56 @@ async def send_request(
     account_index: int = 0,
     session: AsyncSession | None = None,
 ) -> tuple[Response | None, Cookies]:
-    """Send http request with provided cookies using provided session or creating a new one."""
-    if session is not None:
-        # Use provided session - just update cookies
-        if isinstance(cookies, dict):
-            session.cookies = Cookies(cookies)
-        else:
-            session.cookies = cookies
-
-        init_url = Endpoint.get_init_url(account_index)
-        response = await session.get(init_url)
-        response.raise_for_status()
-
-        # Check if redirected to consent page - means cookies are expired/invalid
-        final_url = str(response.url)
-        if "consent.google.com" in final_url:
-            raise AuthError(
-                f"Redirected to Google consent page. This typically means your cookies are expired or invalid "
-                f"for account index {account_index}. Please update your __Secure-1PSID and __Secure-1PSIDTS cookies."
-            )
-
-        return response, session.cookies
-
-    # Create a new temporary session (fallback for standalone usage)
-    async with AsyncSession(
-        proxy=proxy,
-        allow_redirects=True,
-        impersonate="chrome",
-        http_version=CurlHttpVersion.V2_0,
-    ) as client:
-        client.headers.update(Headers.GEMINI.value)
-        if isinstance(cookies, dict):
-            client.cookies = Cookies(cookies)
-        else:
-            client.cookies = cookies
-
-        init_url = Endpoint.get_init_url(account_index)
-        response = await client.get(init_url)
-        response.raise_for_status()
+    """
+    Send http request with provided cookies using provided session or creating a new one.
 
-        # Check if redirected to consent page - means cookies are expired/invalid
-        final_url = str(response.url)
-        if "consent.google.com" in final_url:
-            raise AuthError(
-                f"Redirected to Google consent page. This typically means your cookies are expired or invalid "
-                f"for account index {account_index}. Please update your __Secure-1PSID and __Secure-1PSIDTS cookies."
-            )
+    Cookies are passed with the request rather than set on the session, so concurrent attempts sharing a session
+    each send their own jar. Returns the response and the request's cookies updated with the ones it set.
+    """
+    from curl_cffi import CurlHttpVersion
+    from curl_cffi.requests import AsyncSession, Cookies
 
-        return response, client.cookies
+    if session is None:
+        # Create a new temporary session (fallback for standalone usage)
+        async with AsyncSession(
+            proxy=proxy,
+            allow_redirects=True,
+            impersonate="chrome",
+            http_version=CurlHttpVersion.V2_0,
+        ) as client:
+            client.headers.update(GEMINI_HEADERS)
+            return await send_request(cookies, proxy=proxy, account_index=account_index, session=client)
 
+    jar = Cookies(cookies)
 
-def _get_secure_1psid(cookies: dict | Cookies) -> str | None:
-    """Safely extract __Secure-1PSID from cookies, preferring .google.com domain."""
-    if isinstance(cookies, Cookies):
-        return cookies.get("__Secure-1PSID", domain=".google.com") or cookies.get("__Secure-1PSID")
-    return cookies.get("__Secure-1PSID")
+    # The session's own cookies are left untouched, so one attempt's cookies never leak into another's request
+    init_url = Endpoint.get_init_url(account_index)
+    response = await session.get(init_url, cookies=jar, discard_cookies=True)
+    response.raise_for_status()
 
+    # Check if redirected to consent page - means cookies are expired/invalid
+    final_url = str(response.url)
+    if "consent.google.com" in final_url:
+        raise AuthError(
+            f"Redirected to Google consent page. This typically means your cookies are expired or invalid "
+            f"for account index {account_index}. Please update your __Secure-1PSID and __Secure-1PSIDTS cookies."
+        )
 
-def _get_cache_dir() -> Path:
-    """Get the cache directory for cookie storage."""
-    gemini_cookie_path = os.getenv("GEMINI_COOKIE_PATH")
-    if gemini_cookie_path:
-        return Path(gemini_cookie_path)
-    return Path(__file__).parent / "temp"
+    jar.update(response.cookies)
+    return response, jar
 
 
 def _create_cookie_jar_with_base(extra_cookies: Cookies, base_cookies: dict | Cookies) -> Cookies:
     """Create a new cookie jar merging extra and base cookies."""
+    from curl_cffi.requests import Cookies
+
     jar = Cookies(extra_cookies)
     jar.update(base_cookies)
     return jar
 
 
 def _add_base_cookie_task(
-    tasks: list[Task],
+    tasks: list[Coroutine[Any, Any, tuple[Response | None, Cookies]]],
     base_cookies: dict | Cookies,
     extra_cookies: Cookies,
     proxy: str | None,
@@ -105,13 +93,13 @@ def _add_base_cookie_task(
 
     if has_psid and has_psidts:
         jar = _create_cookie_jar_with_base(extra_cookies, base_cookies)
-        tasks.append(Task(send_request(jar, proxy=proxy, account_index=account_index, session=session)))
+        tasks.append(send_request(jar, proxy=proxy, account_index=account_index, session=session))
     elif verbose:
         logger.debug("Skipping loading base cookies. Either __Secure-1PSID or __Secure-1PSIDTS is not provided.")
 
 
-def _add_cached_cookie_tasks(
-    tasks: list[Task],
+async def _add_cached_cookie_tasks(
+    tasks: list[Coroutine[Any, Any, tuple[Response | None, Cookies]]],
     base_cookies: dict | Cookies,
     extra_cookies: Cookies,
     cache_dir: Path,
@@ -121,15 +109,15 @@ def _add_cached_cookie_tasks(
     account_index: int = 0,
     session: AsyncSession | None = None,
 ) -> None:
-    """Add tasks for cached cookie files."""
+    """Add tasks for cached cookie files. Reading the cache is blocking file I/O, so it's kept off the event loop."""
     if secure_1psid:
-        _add_single_cached_cookie_task(tasks, base_cookies, extra_cookies, cache_dir, secure_1psid, proxy, verbose, account_index, session=session)
+        await asyncio.to_thread(_add_single_cached_cookie_task, tasks, base_cookies, extra_cookies, cache_dir, secure_1psid, proxy, verbose, account_index, session=session)
     else:
-        _add_all_cached_cookie_tasks(tasks, extra_cookies, cache_dir, proxy, verbose, account_index, session=session)
+        await _add_all_cached_cookie_tasks(tasks, extra_cookies, cache_dir, proxy, verbose, account_index, session=session)
 
 
 def _add_single_cached_cookie_task(
-    tasks: list[Task],
+    tasks: list[Coroutine[Any, Any, tuple[Response | None, Cookies]]],
     base_cookies: dict | Cookies,
     extra_cookies: Cookies,
     cache_dir: Path,
@@ -140,26 +128,24 @@ def _add_single_cached_cookie_task(
     session: AsyncSession | None = None,
 ) -> None:
     """Add task for a specific cached cookie file matching the provided PSID."""
-    cache_file = cache_dir / f".cached_1psidts_{secure_1psid}.txt"
-
-    if not cache_file.is_file():
+    cached_1psidts = read_cached_1psidts(get_cache_file(secure_1psid, cache_dir))
+    if cached_1psidts is None:
         if verbose:
             logger.debug("Skipping loading cached cookies. Cache file not found.")
         return
 
-    cached_1psidts = cache_file.read_text()
     if not cached_1psidts:
         if verbose:
             logger.debug("Skipping loading cached cookies. Cache file is empty.")
         return
 
     jar = _create_cookie_jar_with_base(extra_cookies, base_cookies)
-    jar.set("__Secure-1PSIDTS", cached_1psidts, domain=".google.com")
-    tasks.append(Task(send_request(jar, proxy=proxy, account_index=account_index, session=session)))
+    jar.jar.set_cookie(make_cookie("__Secure-1PSIDTS", cached_1psidts, ".google.com"))
+    tasks.append(send_request(jar, proxy=proxy, account_index=account_index, session=session))
 
 
-def _add_all_cached_cookie_tasks(
-    tasks: list[Task],
+async def _add_all_cached_cookie_tasks(
+    tasks: list[Coroutine[Any, Any, tuple[Response | None, Cookies]]],
     extra_cookies: Cookies,
     cache_dir: Path,
     proxy: str | None,
@@ -168,44 +154,57 @@ def _add_all_cached_cookie_tasks(
     session: AsyncSession | None = None,
 ) -> None:
     """Add tasks for all valid cached cookie files."""
+    from curl_cffi.requests import Cookies
+
     valid_caches = 0
 
-    for cache_file in cache_dir.glob(".cached_1psidts_*.txt"):
-        cached_1psidts = cache_file.read_text()
+    # Files are read concurrently in worker threads, so reads of many cached accounts overlap
+    cache_files = await asyncio.to_thread(list_cache_files, cache_dir)
+    contents = await asyncio.gather(*(asyncio.to_thread(read_cached_1psidts, cache_file) for _, cache_file in cache_files))
+
+    for (psid, _), cached_1psidts in zip(cache_files, contents, strict=True):
         if not cached_1psidts:
             continue
 
+        # Cookie objects are built directly (and shared across attempts) instead of going through Cookies.set
         jar = Cookies(extra_cookies)
-        psid = cache_file.stem[16:]  # Extract PSID from filename
-        jar.set("__Secure-1PSID", psid, domain=".google.com")
-        jar.set("__Secure-1PSIDTS", cached_1psidts, domain=".google.com")
-        tasks.append(Task(send_request(jar, proxy=proxy, account_index=account_index, session=session)))
+        jar.jar.set_cookie(make_cookie("__Secure-1PSID", psid, ".google.com"))
+        jar.jar.set_cookie(make_cookie("__Secure-1PSIDTS", cached_1psidts, ".google.com"))
+        tasks.append(send_request(jar, proxy=proxy, account_index=account_index, session=session))
         valid_caches += 1
 
     if valid_caches == 0 and verbose:
         logger.debug("Skipping loading cached cookies. Cookies will be cached after successful initialization.")
 
 
-def _extract_tokens_from_response(response_text: str) -> tuple[str | None, str | None, str | None]:
+def _extract_tokens_from_response(response_content: bytes) -> tuple[str | None, str | None, str | None]:
     """Extract SNlM0e, cfb2h, and FdrFJe tokens from response HTML.
 
     Google removed SNlM0e from the page around Feb 2025, but cfb2h and FdrFJe
     are still present and sufficient for API calls. Returns empty string for
     SNlM0e if not found, which works correctly with the API.
     """
-    snlm0e_match = re.search(r'"SNlM0e":\s*"(.*?)"', response_text)
-    cfb2h_match = re.search(r'"cfb2h":\s*"(.*?)"', response_text)
-    fdrfje_match = re.search(r'"FdrFJe":\s*"(.*?)"', response_text)
+    snlm0e = _find_token(response_content, b'"SNlM0e":')
+    cfb2h = _find_token(response_content, b'"cfb2h":')
+    fdrfje = _find_token(response_content, b'"FdrFJe":')
 
     # Return None tuple if no tokens found at all
-    if not (snlm0e_match or cfb2h_match or fdrfje_match):
+    if snlm0e is None and cfb2h is None and fdrfje is None:
         return None, None, None
 
-    return (
-        snlm0e_match.group(1) if snlm0e_match else "",
-        cfb2h_match.group(1) if cfb2h_match else None,
-        fdrfje_match.group(1) if fdrfje_match else None,
-    )
+    return snlm0e if snlm0e is not None else "", cfb2h, fdrfje
+
+
+def _find_token(response_content: bytes, key: bytes) -> str | None:
+    """Return the string value of the first `key` entry in response HTML, or None if there is none."""
+    index = response_content.find(key)
+    while index != -1:
+        start = index + len(key)
+        match = _TOKEN_VALUE_RE.match(response_content, start, start + _TOKEN_VALUE_WINDOW)
+        if match:
+            return match[1].decode()
+        index = response_content.find(key, start)
+    return None
 
 
 async def get_access_token(
@@ -248,46 +247,70 @@ async def get_access_token(
     `gemini_webapi.AuthError`
         If all requests failed.
     """
-    # Fetch initial cookies from google.com
+    from curl_cffi import CurlHttpVersion
+    from curl_cffi.requests import AsyncSession
+
     if session is not None:
-        response = await session.get(Endpoint.GOOGLE)
-    else:
-        async with AsyncSession(
-            proxy=proxy,
-            allow_redirects=True,
-            impersonate="chrome",
-            http_version=CurlHttpVersion.V2_0,
-        ) as client:
-            response = await client.get(Endpoint.GOOGLE)
+        return await _get_access_token(base_cookies, proxy, verbose, account_index, session)
+
+    # One temporary session serves the google.com request and every init attempt, so they share a connection
+    async with AsyncSession(
+        proxy=proxy,
+        allow_redirects=True,
+        impersonate="chrome",
+        http_version=CurlHttpVersion.V2_0,
+    ) as client:
+        client.headers.update(GEMINI_HEADERS)
+        return await _get_access_token(base_cookies, proxy, verbose, account_index, client)
+
+
+async def _get_access_token(
+    base_cookies: dict | Cookies,
+    proxy: str | None,
+    verbose: bool,
+    account_index: int,
+    session: AsyncSession,
+) -> tuple[str, str | None, str | None, Cookies]:
+    """Run `get_access_token` over `session`."""
+    from curl_cffi.requests import Cookies
+
+    # Fetch initial cookies from google.com
+    response = await session.get(Endpoint.GOOGLE)
 
     extra_cookies = response.cookies if response.status_code == 200 else Cookies()
-    cache_dir = _get_cache_dir()
-    secure_1psid = _get_secure_1psid(base_cookies)
+    cache_dir = get_cache_dir()
+    secure_1psid = get_secure_1psid(base_cookies)
 
-    # Collect authentication tasks from various sources
-    tasks: list[Task] = []
+    # Collect authentication attempts from various sources
+    tasks: list[Coroutine[Any, Any, tuple[Response | None, Cookies]]] = []
     _add_base_cookie_task(tasks, base_cookies, extra_cookies, proxy, verbose, account_index, session=session)
-    _add_cached_cookie_tasks(tasks, base_cookies, extra_cookies, cache_dir, secure_1psid, proxy, verbose, account_index, session=session)
+    await _add_cached_cookie_tasks(tasks, base_cookies, extra_cookies, cache_dir, secure_1psid, proxy, verbose, account_index, session=session)
 
     if not tasks:
         raise AuthError("No valid cookies available for initialization. Please pass __Secure-1PSID and __Secure-1PSIDTS manually.")
 
-    # Try each authentication method until one succeeds
-    for i, future in enumerate(asyncio.as_completed(tasks)):
-        try:
-            response, request_cookies = await future
-            snlm0e, cfb2h, fdrfje = _extract_tokens_from_response(response.text)
+    # Try all authentication methods concurrently over the shared session, the first one to succeed wins
+    attempts = [asyncio.ensure_future(task) for task in tasks]
+    try:
+        for i, future in enumerate(asyncio.as_completed(attempts)):
+            try:
+                response, request_cookies = await future
+                snlm0e, cfb2h, fdrfje = _extract_tokens_from_response(response.content)
+
+                # Success if any token is found (SNlM0e was removed by Google around Feb 2025)
+                if snlm0e is not None or cfb2h or fdrfje:
+                    if verbose:
+                        logger.debug(f"Init attempt ({i + 1}/{len(tasks)}) succeeded. Initializing client...")
+                    return snlm0e, cfb2h, fdrfje, request_cookies
 
-            # Success if any token is found (SNlM0e was removed by Google around Feb 2025)
-            if snlm0e is not None or cfb2h or fdrfje:
                 if verbose:
-                    logger.debug(f"Init attempt ({i + 1}/{len(tasks)}) succeeded. Initializing client...")
-                return snlm0e, cfb2h, fdrfje, request_cookies
-
-            if verbose:
-                logger.debug(f"Init attempt ({i + 1}/{len(tasks)}) failed. Cookies invalid.")
-        except Exception as e:
-            if verbose:
-                logger.debug(f"Init attempt ({i + 1}/{len(tasks)}) failed with error: {e}")
+                    logger.debug(f"Init attempt ({i + 1}/{len(tasks)}) failed. Cookies invalid.")
+            except Exception as e:
+                if verbose:
+                    logger.debug(f"Init attempt ({i + 1}/{len(tasks)}) failed with error: {e}")
+    finally:
+        # Attempts still in flight after a success are cancelled rather than left running on the session
+        for attempt in attempts:
+            attempt.cancel()
 
     raise AuthError(f"Failed to initialize client. SECURE_1PSIDTS could get expired frequently, please make sure cookie values are up to date. (Failed initialization attempts: {len(tasks)})")
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .logger import logger
+
+if TYPE_CHECKING:
+    from curl_cffi.requests import AsyncSession, Response
+
+
+async def follow_text_redirects(
+    client: AsyncSession,
+    url: str,
+    content_type: str,
+    fallback_url: str | None = None,
+    max_hops: int = 5,
+    **request_kwargs,
+) -> tuple[Response, bool]:
+    """
+    Follow Google's text-based redirect chain, where a `text/plain` response body holds the next URL,
+    until a response of the wanted content type is reached.
+
+    Every hop is requested in stream mode. Redirect and error bodies are read here, the body of the
+    final response is left unread so the caller can stream it to disk.
+
+    Parameters
+    ----------
+    client: `curl_cffi.requests.AsyncSession`
+        Session used for every hop.
+    url: `str`
+        URL to start from.
+    content_type: `str`
+        Prefix of the Content-Type header identifying the final response, e.g. "image/".
+    fallback_url: `str`, optional
+        URL to restart from if the first hop neither redirects nor returns the wanted content.
+    max_hops: `int`, optional
+        Max number of requests to make, by default 5.
+    request_kwargs: `dict`, optional
+        Extra arguments passed to every request (e.g. headers and cookies for a shared session).
+
+    Returns
+    -------
+    `tuple[curl_cffi.requests.Response, bool]`
+        The last response and whether it is the wanted content.
+    """
+
+    current_url = url
+    response = None
+    # Bound once, these are looked up on every hop otherwise
+    get = client.get
+    debug = logger.debug
+
+    # Debug messages use loguru's deferred formatting, so nothing is formatted unless debug logging is enabled
+    for hop in range(max_hops):
+        debug("Download hop {}: {:.80}...", hop + 1, current_url)
+        response = await get(current_url, stream=True, **request_kwargs)
+        status_code = response.status_code
+        response_type = response.headers.get("content-type", "")
+        debug("  Status: {}, Content-Type: {}", status_code, response_type or "N/A")
+
+        if status_code != 200:
+            body = await response.atext()
+            debug("  Non-200 response, body: {:.200}", body or "N/A")
+        # If we got the wanted content, we're done
+        elif response_type.startswith(content_type):
+            return response, True
+        else:
+            body = await response.atext()
+
+            # If we got text/plain, the body contains the redirect URL
+            if response_type.startswith("text/plain"):
+                new_url = body.strip()
+                debug("  Text redirect to: {:.80}...", new_url)
+                if new_url.startswith("http"):
+                    current_url, fallback_url = new_url, None
+                    continue
+
+            # Unknown content type, stop
+            debug("  Unknown content type, stopping")
+
+        if fallback_url:
+            debug("  Falling back to {:.80}...", fallback_url)
+            current_url, fallback_url = fallback_url, None
+            continue
+        break
+
+    return response, False
@@ -9,9 +9,81 @@ Each line contains 7 tab-separated fields:
 domain, domain_specified, path, secure, expiration, name, value
 """
 
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from curl_cffi.requests import Cookies
+
+
+def _iter_cookie_rows(
+    lines: Iterable[str],
+    domain_filter: str | None = None,
+) -> Iterator[tuple[str, str, bool, str, str]]:
+    """
+    Parse Netscape cookie lines, yielding (domain, path, secure, name, value) for every valid cookie.
+
+    Comments, empty lines and lines without exactly 7 fields are skipped.
+    """
+
+    domain_filter = domain_filter.lower() if domain_filter else None
+
+    for line in lines:
+        # Skip header lines and comments, empty lines are dropped by the field count check below
+        if not line or line[0] == "#":
+            continue
+
+        # Only the last field carries the line ending, and splitting stops once the 7 fields are found
+        parts = line.rstrip("\r\n").split("\t", 6)
+
+        # Netscape cookie format must have exactly 7 fields:
+        # domain, domain_specified, path, secure, expiration, name, value
+        if len(parts) != 7:
+            continue
+
+        domain = parts[0]
+
+        # Apply domain filter if specified (case-insensitive substring match)
+        if domain_filter and domain_filter not in domain.lower():
+            continue
 
-from curl_cffi.requests import Cookies
+        yield domain, parts[2], parts[3].upper() == "TRUE", parts[5], parts[6]
+
+
+def _iter_cookie_file(
+    file_path: str | Path,
+    domain_filter: str | None = None,
+) -> Iterator[tuple[str, str, bool, str, str]]:
+    """
+    Yield cookie rows from a Netscape cookie file, reading it line by line instead of loading it whole.
+    """
+
+    file_path = Path(file_path)
+
+    if not file_path.exists():
+        raise FileNotFoundError(f"Cookie file not found: {file_path}")
+
+    with file_path.open(encoding="utf-8", errors="ignore") as f:
+        yield from _iter_cookie_rows(f, domain_filter)
+
+
+def _build_cookies(rows: Iterable[tuple[str, str, bool, str, str]]) -> Cookies:
+    """
+    Collect cookie rows into a curl_cffi Cookies object, keeping each cookie's own domain and path.
+    """
+
+    from curl_cffi.requests import Cookies
+
+    cookies = Cookies()
+
+    for domain, path, _, name, value in rows:
+        # Set cookie with proper domain to ensure it's sent to correct endpoints
+        cookies.set(name, value, domain=domain, path=path)
+
+    return cookies
 
 
 def load_netscape_cookies(
@@ -47,13 +119,7 @@ def load_netscape_cookies(
     >>> cookies = load_netscape_cookies("cookies.txt")
     >>> cookies = load_netscape_cookies("google_cookies.txt", domain_filter="google")
     """
-    file_path = Path(file_path)
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"Cookie file not found: {file_path}")
-
-    content = file_path.read_text(encoding="utf-8", errors="ignore")
-    return parse_netscape_cookies(content, domain_filter=domain_filter)
+    return _build_cookies(_iter_cookie_file(file_path, domain_filter))
 
 
 def parse_netscape_cookies(
@@ -78,39 +144,7 @@ def parse_netscape_cookies(
     Cookies
         curl_cffi Cookies object containing the parsed cookies with proper domains.
     """
-    lines = content.splitlines()
-    cookies = Cookies()
-
-    for line in lines:
-        # Skip header lines and comments
-        if line.startswith("# Netscape") or line.startswith("# This is a generated"):
-            continue
-
-        # Skip comments and empty lines
-        if line.startswith("#") or not line.strip():
-            continue
-
-        parts = line.strip().split("\t")
-
-        # Netscape cookie format must have exactly 7 fields:
-        # domain, domain_specified, path, secure, expiration, name, value
-        if len(parts) != 7:
-            continue
-
-        # Parse cookie fields
-        domain = parts[0]
-        path = parts[2]
-        name = parts[5]
-        value = parts[6]
-
-        # Apply domain filter if specified (case-insensitive substring match)
-        if domain_filter and domain_filter.lower() not in domain.lower():
-            continue
-
-        # Set cookie with proper domain to ensure it's sent to correct endpoints
-        cookies.set(name, value, domain=domain, path=path)
-
-    return cookies
+    return _build_cookies(_iter_cookie_rows(content.splitlines(), domain_filter))
 
 
 def load_netscape_cookies_full(
@@ -141,46 +175,16 @@ def load_netscape_cookies_full(
     >>> for c in cookies:
     ...     print(f"{c['name']}: {c['domain']}")
     """
-    file_path = Path(file_path)
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"Cookie file not found: {file_path}")
-
-    content = file_path.read_text(encoding="utf-8", errors="ignore")
-    cookies = []
-
-    for line in content.splitlines():
-        # Skip header lines and comments
-        if line.startswith("#") or not line.strip():
-            continue
-
-        parts = line.strip().split("\t")
-
-        # Netscape format has 7 fields
-        if len(parts) != 7:
-            continue
-
-        domain = parts[0]
-        path = parts[2]
-        secure = parts[3].upper() == "TRUE"
-        name = parts[5]
-        value = parts[6]
-
-        # Apply domain filter
-        if domain_filter and domain_filter.lower() not in domain.lower():
-            continue
-
-        cookies.append(
-            {
-                "domain": domain,
-                "path": path,
-                "secure": secure,
-                "name": name,
-                "value": value,
-            }
-        )
-
-    return cookies
+    return [
+        {
+            "domain": domain,
+            "path": path,
+            "secure": secure,
+            "name": name,
+            "value": value,
+        }
+        for domain, path, secure, name, value in _iter_cookie_file(file_path, domain_filter)
+    ]
 
 
 def load_netscape_cookies_as_dict(
@@ -210,33 +214,4 @@ def load_netscape_cookies_as_dict(
     >>> cookies = load_netscape_cookies_as_dict("cookies.txt", domain_filter="google")
     >>> client = GeminiClient(cookies.get("__Secure-1PSID"), cookies.get("__Secure-1PSIDTS"))
     """
-    file_path = Path(file_path)
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"Cookie file not found: {file_path}")
-
-    content = file_path.read_text(encoding="utf-8", errors="ignore")
-    result = {}
-
-    for line in content.splitlines():
-        # Skip header lines and comments
-        if line.startswith("#") or not line.strip():
-            continue
-
-        parts = line.strip().split("\t")
-
-        # Netscape format has 7 fields
-        if len(parts) != 7:
-            continue
-
-        domain = parts[0]
-        name = parts[5]
-        value = parts[6]
-
-        # Apply domain filter
-        if domain_filter and domain_filter.lower() not in domain.lower():
-            continue
-
-        result[name] = value
-
-    return result
+    return {name: value for _, _, _, name, value in _iter_cookie_file(file_path, domain_filter)}
@@ -1,23 +1,37 @@
+from __future__ import annotations
+
+import asyncio
 import io
-import random
+import os
+import secrets
+import stat
+from functools import lru_cache
 from pathlib import Path
-
-from curl_cffi import CurlHttpVersion
-from curl_cffi.requests import AsyncSession
-from pydantic import ConfigDict, validate_call
+from typing import TYPE_CHECKING
 
 from ..constants import Endpoint
 from .logger import logger
 
+# curl_cffi is imported where it's needed at runtime, so importing the package doesn't load its native extension
+if TYPE_CHECKING:
+    from curl_cffi.requests import AsyncSession, Headers, Response
+
 
 def _generate_random_name(extension: str = ".txt") -> str:
     """
-    Generate a random filename using a large integer for better performance.
+    Generate a random filename from 4 random bytes, formatted as 8 hex characters.
     """
 
-    return f"input_{random.randint(1000000, 9999999)}{extension}"
+    return f"input_{secrets.token_hex(4)}{extension}"
 
 
+# Sessions used by `upload_file` when none is passed, keyed by (proxy, id(event loop)) as sessions can't be shared across loops.
+# A session holds a reference to its loop, so a loop id can't be reused while its entry is in the pool.
+_SESSION_POOL: dict[tuple[str | None, int], AsyncSession] = {}
+
+# Files up to this size (bytes) are read on the event loop, larger ones in a worker thread
+_INLINE_READ_MAX_SIZE = 64 << 10
+
 # Headers for the resumable upload protocol
 _UPLOAD_START_HEADERS = {
     "Origin": "https://gemini.google.com",
@@ -38,7 +52,17 @@ _UPLOAD_FINALIZE_HEADERS = {
 }
 
 
-@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+@lru_cache(maxsize=1)
+def _get_finalize_headers() -> Headers:
+    """
+    Normalize the finalize headers once, curl_cffi copies a `Headers` instance as-is when merging it with the session headers.
+    """
+
+    from curl_cffi.requests import Headers
+
+    return Headers(_UPLOAD_FINALIZE_HEADERS)
+
+
 async def upload_file(
     file: str | Path | bytes | io.BytesIO,
     proxy: str | None = None,
@@ -56,13 +80,15 @@ async def upload_file(
     Parameters
     ----------
     file : `str` | `Path` | `bytes` | `io.BytesIO`
-        Path to the file or file content to be uploaded.
+        Path to the file or file content to be uploaded. Content is read when it is sent, after the upload
+        has been initiated, so a BytesIO must not be closed before this call returns.
     proxy: `str`, optional
         Proxy URL.
     filename: `str`, optional
         Name of the file to be uploaded. Required if file is bytes or BytesIO.
     session: `AsyncSession`, optional
-        Existing session to use for the request.
+        Existing session to use for the request. If not provided, a session shared by uploads
+        with the same proxy is used, see `close_upload_sessions` to close it.
     account_index: `int`, optional
         Google account index for multi-account support. Defaults to 0.
 
@@ -74,23 +100,44 @@ async def upload_file(
 
     Raises
     ------
+    `ValueError`
+        If `file` is not an existing file path, bytes or a BytesIO object.
     `curl_cffi.requests.errors.RequestsError`
         If the upload request failed.
     """
 
-    if isinstance(file, (str, Path)):
-        file_path = Path(file)
-        if not file_path.is_file():
-            raise ValueError(f"{file_path} is not a valid file.")
+    identifier, _ = await _upload(file, proxy, filename, session, account_index)
+    return identifier
+
+
+async def _upload(
+    file: str | Path | bytes | io.BytesIO,
+    proxy: str | None,
+    filename: str | None,
+    session: AsyncSession | None,
+    account_index: int,
+) -> tuple[str, str]:
+    """
+    Run `upload_file`, returning the identifier of the uploaded file together with the file name it was uploaded under.
+    """
+
+    if isinstance(file, str):
+        file = Path(file)
+
+    # Only the size is needed to initiate the upload, file content is read right before it is sent
+    if isinstance(file, Path):
+        # A single stat both validates the path and gives the size, run in a worker thread like the read itself
+        file_stat = await asyncio.to_thread(_stat_regular_file, file)
         if not filename:
-            filename = file_path.name
-        file_content = file_path.read_bytes()
+            filename = file.name
+        content_length = file_stat.st_size
     elif isinstance(file, io.BytesIO):
-        file_content = file.getvalue()
+        with file.getbuffer() as view:
+            content_length = view.nbytes
         if not filename:
             filename = _generate_random_name()
     elif isinstance(file, bytes):
-        file_content = file
+        content_length = len(file)
         if not filename:
             filename = _generate_random_name()
     else:
@@ -100,27 +147,132 @@ async def upload_file(
     logger.debug(f"Initiating resumable upload to: {upload_url}")
 
     # Prepare headers for step 1 (initiate upload)
-    start_headers = {
-        **_UPLOAD_START_HEADERS,
-        "X-Goog-Upload-Header-Content-Length": str(len(file_content)),
-    }
+    start_headers = _UPLOAD_START_HEADERS.copy()
+    start_headers["X-Goog-Upload-Header-Content-Length"] = str(content_length)
+
+    if session is None:
+        session = _get_pooled_session(proxy)
+
+    return await _upload_with_session(session, upload_url, file, content_length, start_headers, filename), filename
+
+
+async def upload_files(
+    files: list[str | Path | bytes | io.BytesIO],
+    proxy: str | None = None,
+    session: AsyncSession | None = None,
+    account_index: int = 0,
+    concurrency: int = 8,
+) -> list[tuple[str, str]]:
+    """
+    Upload multiple files concurrently over a single session, see `upload_file`.
+
+    Prefer this over gathering `upload_file` calls: all uploads share one session, so they are
+    multiplexed over its HTTP/2 connection rather than each setting up their own.
+
+    Parameters
+    ----------
+    files : `list[str | Path | bytes | io.BytesIO]`
+        Paths to the files or file contents to be uploaded.
+    proxy: `str`, optional
+        Proxy URL.
+    session: `AsyncSession`, optional
+        Existing session to use for the requests. If not provided, the session shared by uploads with the same proxy is used.
+    account_index: `int`, optional
+        Google account index for multi-account support. Defaults to 0.
+    concurrency: `int`, optional
+        Maximum number of files uploaded at the same time, by default 8.
+
+    Returns
+    -------
+    `list[tuple[str, str]]`
+        (identifier, file name) of each uploaded file, in the same order as `files`. The file name is taken
+        from the path, or generated for in-memory data, during the upload, so `parse_file_name` isn't needed.
+
+    Raises
+    ------
+    `ValueError`
+        If any of `files` is not an existing file path, bytes or a BytesIO object.
+    `curl_cffi.requests.errors.RequestsError`
+        If any of the upload requests failed.
+    """
+
+    if not files:
+        return []
+
+    if session is None:
+        session = _get_pooled_session(proxy)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _upload_one(file: str | Path | bytes | io.BytesIO) -> tuple[str, str]:
+        async with semaphore:
+            return await _upload(file, proxy, None, session, account_index)
+
+    return list(await asyncio.gather(*(_upload_one(file) for file in files)))
+
+
+def _get_pooled_session(proxy: str | None) -> AsyncSession:
+    """
+    Get the upload session for `proxy` on the running event loop, creating it on first use.
+
+    Sessions are kept open so repeated uploads reuse their connections instead of doing a new TLS handshake each time,
+    and concurrent uploads (e.g. from `upload_files`) are multiplexed over a single HTTP/2 connection.
+    Creating one doesn't await, so concurrent uploads can't race to create duplicates.
+    """
 
-    if session is not None:
-        return await _upload_with_session(session, upload_url, file_content, start_headers, filename)
+    from curl_cffi import CurlHttpVersion, CurlOpt
+    from curl_cffi.requests import AsyncSession
 
-    async with AsyncSession(
-        proxy=proxy,
-        allow_redirects=True,
-        impersonate="chrome",
-        http_version=CurlHttpVersion.V2_0,
-    ) as client:
-        return await _upload_with_session(client, upload_url, file_content, start_headers, filename)
+    _drop_closed_loop_sessions()
+
+    loop = asyncio.get_running_loop()
+    key = (proxy, id(loop))
+    session = _SESSION_POOL.get(key)
+    if session is None:
+        session = _SESSION_POOL[key] = AsyncSession(
+            loop=loop,
+            proxy=proxy,
+            allow_redirects=False,
+            impersonate="chrome",
+            http_version=CurlHttpVersion.V2_0,
+            # libcurl multiplexes HTTP/2 by default, but concurrent uploads started before the first connection
+            # is up would each open their own. PIPEWAIT makes them wait and share that connection instead.
+            curl_options={CurlOpt.PIPEWAIT: 1},
+        )
+    return session
+
+
+def _drop_closed_loop_sessions() -> None:
+    """
+    Remove pooled sessions whose event loop has been closed (e.g. by `asyncio.run`) without `close_upload_sessions`.
+
+    Such sessions can no longer be closed, as closing awaits on their loop. Dropping them releases both the session and the loop,
+    and lets the loop's id be reused safely.
+    """
+
+    for key in [key for key, session in _SESSION_POOL.items() if session.loop.is_closed()]:
+        del _SESSION_POOL[key]
+
+
+async def close_upload_sessions() -> None:
+    """
+    Close the sessions `upload_file` keeps open for uploads made without an explicit `session`,
+    on the running event loop. Uploads made after this open a new session.
+
+    Call this before the event loop is closed, e.g. at the end of the coroutine passed to `asyncio.run`.
+    Sessions of loops closed without it are dropped unclosed on the next upload.
+    """
+
+    loop_id = id(asyncio.get_running_loop())
+    for key in [key for key in _SESSION_POOL if key[1] == loop_id]:
+        await _SESSION_POOL.pop(key).close()
 
 
 async def _upload_with_session(
     session: AsyncSession,
     upload_url: str,
-    file_content: bytes,
+    file: Path | bytes | io.BytesIO,
+    content_length: int,
     start_headers: dict,
     filename: str,
 ) -> str:
@@ -133,9 +285,11 @@ async def _upload_with_session(
         url=upload_url,
         headers=start_headers,
         data=init_body,
+        allow_redirects=False,
     )
     logger.debug(f"Upload initiation response: {response.status_code}")
-    response.raise_for_status()
+    if response.status_code >= 300:
+        _raise_for_status(response)
 
     # Extract the upload URL from response headers
     resumable_url = response.headers.get("x-goog-upload-url")
@@ -147,15 +301,50 @@ async def _upload_with_session(
     # Step 2: Upload the actual file data
     response = await session.post(
         url=resumable_url,
-        headers=_UPLOAD_FINALIZE_HEADERS,
-        data=file_content,
+        headers=_get_finalize_headers(),
+        data=await _read_file_content(file, content_length),
+        allow_redirects=False,
     )
     logger.debug(f"Upload finalize response: {response.status_code} - {response.text[:200] if response.text else 'empty'}")
-    response.raise_for_status()
+    if response.status_code >= 300:
+        _raise_for_status(response)
 
     return response.text
 
 
+def _raise_for_status(response: Response) -> None:
+    """
+    Raise for a non-2xx response. Redirects raise too, the upload protocol doesn't use them and uploads don't follow them.
+    """
+
+    if response.status_code >= 400:
+        response.raise_for_status()
+
+    from curl_cffi.requests.exceptions import HTTPError
+
+    raise HTTPError(f"Unexpected redirect during upload: {response.status_code} {response.reason}", 0, response)
+
+
+async def _read_file_content(file: Path | bytes | io.BytesIO, size: int) -> bytes:
+    """
+    Load the request body for the finalize step.
+
+    curl_cffi only accepts in-memory request bodies, so files are still read whole, but only once the
+    upload has been initiated, and in a worker thread to keep disk I/O off the event loop. Small files
+    are read inline, for them the thread hand-off costs more than the read itself.
+    A `bytes` body is handed to libcurl by reference (CURLOPT_POSTFIELDS), so it isn't copied again
+    when sent; `memoryview` or `mmap` bodies are rejected by curl_cffi and would not avoid a copy.
+    """
+
+    if isinstance(file, Path):
+        if size <= _INLINE_READ_MAX_SIZE:
+            return file.read_bytes()
+        return await asyncio.to_thread(file.read_bytes)
+    if isinstance(file, io.BytesIO):
+        return file.getvalue()
+    return file
+
+
 def parse_file_name(file: str | Path | bytes | io.BytesIO) -> str:
     """
     Parse the file name from the given path or generate a random one for in-memory data.
@@ -171,10 +360,25 @@ def parse_file_name(file: str | Path | bytes | io.BytesIO) -> str:
         File name with extension.
     """
 
-    if isinstance(file, (str, Path)):
+    if isinstance(file, str):
         file = Path(file)
-        if not file.is_file():
-            raise ValueError(f"{file} is not a valid file.")
+
+    if isinstance(file, Path):
+        _stat_regular_file(file)
         return file.name
 
     return _generate_random_name()
+
+
+def _stat_regular_file(file: Path) -> os.stat_result:
+    """
+    Stat `file` once, raising `ValueError` unless it's an existing regular file.
+    """
+
+    try:
+        file_stat = file.stat()
+    except OSError:
+        raise ValueError(f"{file} is not a valid file.") from None
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise ValueError(f"{file} is not a valid file.")
+    return file_stat